@@ -66,6 +66,3 @@ class EventArgs(AbstractEvent):
         eargs._event_source = args.event_source
         eargs.event_data = args.event_data
         return eargs
-
-
-e = EventArgs(None)
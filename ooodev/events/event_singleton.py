@@ -64,14 +64,13 @@ class _Events(object):
                     continue
                 if event_args is not None:
                     event_args._event_name = event_name
-                    if event_args.event_source is None:
+                    if event_args._event_source is None:
                         event_args._event_source = self
                 if callable(callback()):
-                    try:
-                        callback()(event_args.source, event_args, *args, **kwargs)
-                    except AttributeError:
-                        # event_arg is None
+                    if event_args is None:
                         callback()(self, None)
+                    else:
+                        callback()(event_args.source, event_args, *args, **kwargs)
             if cleanup is not None and len(cleanup) > 0:
                 # reverse list to allow removing form highest to lowest to avoid errors
                 cleanup.reverse()
@@ -102,11 +102,10 @@ class _event_base(object):
                     continue
                 self._set_event_args(event_name=event_name, event_args=event_args)
                 if callable(callback()):
-                    try:
-                        callback()(event_args.source, event_args, *args, **kwargs)
-                    except AttributeError:
-                        # event_arg is None
+                    if event_args is None:
                         callback()(self, None)
+                    else:
+                        callback()(event_args.source, event_args, *args, **kwargs)
             if cleanup is not None and len(cleanup) > 0:
                 cleanup.reverse()
                 for i in cleanup:
@@ -1,43 +1,57 @@
 # coding: utf-8
 from __future__ import annotations
-from typing import Any, List, TYPE_CHECKING
-from ..utils.type_var import PathOrStr
+from typing import Any, Sequence, TYPE_CHECKING
+
 if TYPE_CHECKING:
     from ..events.args.event_args import EventArgs
+    from ..utils.type_var import PathOrStr
 
 
 class MissingInterfaceError(Exception):
     """Error when a interface is not found for a uno object"""
 
+    __slots__ = ("interface", "_str_cache")
+
     def __init__(self, interface: Any, message: Any = None, *args) -> None:
         """
         MissingInterfaceError constructor
 
         Args:
             interface (Any): Missing Interface that caused error
-            message (Any, optional): Message of error
+            message (Any, optional): Message of error.
+                If omitted, ``args`` holds ``None`` in its place and a default message is built by ``str()``.
         """
-        if message is None:
-            try:
-                message = f"Missing interface {interface.__pyunointerface__}"
-            except AttributeError:
-                message = "Missing Uno Interface Error"
-        super().__init__(interface, message, *args)
+        super().__init__(message, *args)
+        self.interface = interface
+        self._str_cache = None
+
+    interface: Any
+    """Gets the missing interface that caused the error"""
+
+    def __reduce__(self):
+        # args only holds message and extra args; interface is needed to rebuild.
+        return (type(self), (self.interface, *self.args))
 
     def __str__(self) -> str:
-        return repr(self.args[1])
+        if self._str_cache is None:
+            message = self.args[0]
+            if message is None:
+                name = getattr(self.interface, "__pyunointerface__", None)
+                message = f"Missing interface {name}" if name else "Missing Uno Interface Error"
+            self._str_cache = repr(message)
+        return self._str_cache
 
 
 class CellError(Exception):
     """Cell error"""
 
-    pass
+    __slots__ = ()
 
 
 class ConfigError(Exception):
     """Config Error"""
 
-    pass
+    __slots__ = ()
 
 
 class PropertyError(Exception):
@@ -45,6 +59,8 @@ class PropertyError(Exception):
     Property Error
     """
 
+    __slots__ = ("_str_cache",)
+
     def __init__(self, prop_name: str, *args: object) -> None:
         """
         PropertyError Constructor
@@ -53,48 +69,64 @@ class PropertyError(Exception):
             prop_name (str): Property name that caused error
         """
         super().__init__(prop_name, *args)
+        self._str_cache = None
 
     def __str__(self) -> str:
-        return repr(f"Property Error for: {self.args[0]}")
+        if self._str_cache is None:
+            self._str_cache = f"'Property Error for: {self.args[0]}'"
+        return self._str_cache
 
 
 class PropertiesError(Exception):
     """Error for multiple properties"""
-    pass
+    __slots__ = ()
 
 
 class PropertyNotFoundError(PropertyError):
     """Property Not Found Error"""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
-        return repr(f"Property not found for: {self.args[0]}")
+        if self._str_cache is None:
+            self._str_cache = f"'Property not found for: {self.args[0]}'"
+        return self._str_cache
 
 
 class GoalDivergenceError(Exception):
     """Error when goal seek result divergence is too high"""
 
+    __slots__ = ("_str_cache",)
+
     def __init__(self, divergence: float, message: Any = None) -> None:
         """
         GoalDivergenceError Constructor
 
         Args:
             divergence (float): divergence amount
-            message (Any, optional): Message of error
+            message (Any, optional): Message of error.
+                If omitted, ``args`` holds ``None`` in its place and a default message is built by ``str()``.
         """
-        if message is None:
-            message = f"Divergence error: {divergence:.4f}"
         super().__init__(divergence, message)
+        self._str_cache = None
 
     def __str__(self) -> str:
-        return repr(self.args[1])
+        if self._str_cache is None:
+            message = self.args[1]
+            if message is None:
+                message = f"Divergence error: {self.args[0]:.4f}"
+            self._str_cache = repr(message)
+        return self._str_cache
 
 
 class UnKnownError(Exception):
     """Error for unknown results"""
-    pass
+    __slots__ = ()
 
 
 class UnOpenableError(Exception):
+    __slots__ = ("_str_cache",)
+
     def __init__(self, fnm: PathOrStr, *args: object) -> None:
         """
         PropertyError Constructor
@@ -103,30 +135,42 @@ class UnOpenableError(Exception):
             fnm (PathOrStr): File path that is not able to be opened.
         """
         super().__init__(fnm, *args)
+        self._str_cache = None
 
     def __str__(self) -> str:
-        return repr(f"Un-openable file: '{self.args[0]}'")
+        if self._str_cache is None:
+            self._str_cache = f"\"Un-openable file: '{self.args[0]}'\""
+        return self._str_cache
 
 class MultiError(Exception):
     """Handles Multiple errors"""
-    def __init__(self, errors: List[Exception]) -> None:
+
+    __slots__ = ("errors", "_str_cache")
+
+    def __init__(self, errors: Sequence[Exception]) -> None:
         """
         MultiError Constructor
 
         Args:
-            errors (List[Exception]): List of errors
+            errors (Sequence[Exception]): Sequence of errors
         """
-        self.errors = errors
+        self.errors = tuple(errors)
         super().__init__(self.errors)
+        self._str_cache = None
 
     def __str__(self) -> str:
-        return "\n".join([str(x) for x in self.errors])
+        if self._str_cache is None:
+            self._str_cache = "\n".join(map(str, self.errors))
+        return self._str_cache
 
 
 class NotSupportedServiceError(Exception):
     """
     Handles errors of service not being supported.
     """
+
+    __slots__ = ("_str_cache",)
+
     def __init__(self, service_name: str, *args: object) -> None:
         """
         NotSupportedServiceError Constructor
@@ -135,9 +179,12 @@ class NotSupportedServiceError(Exception):
             service_name (str): Service name
         """
         super().__init__(service_name, *args)
+        self._str_cache = None
 
     def __str__(self) -> str:
-        return repr(f"Service not supported: '{self.args[0]}'")
+        if self._str_cache is None:
+            self._str_cache = f"\"Service not supported: '{self.args[0]}'\""
+        return self._str_cache
 
 class NotSupportedMacroModeError(Exception):
     """
@@ -146,83 +193,110 @@ class NotSupportedMacroModeError(Exception):
     This error is largely used for methods that require external imports
     such as XML.apply_xslt()
     """
-    pass
+    __slots__ = ()
 
 class CreateInstanceError(Exception):
     """Create instance Error"""
+
+    __slots__ = ("interface", "service", "_str_cache")
+
     def __init__(self, interface: Any, service: str, message: Any = None, *args) -> None:
         """
         constructor
 
         Args:
             interface (Any): Interface that failed creation
-            message (Any, optional): Message of error
+            service (str): Service name that failed creation
+            message (Any, optional): Message of error.
+                If omitted, ``args`` holds ``None`` in its place and a default message is built by ``str()``.
         """
-        if message is None:
-            message = f"Unable to create instance of {service}"
-        super().__init__(interface, service, message, *args)
+        super().__init__(message, *args)
+        self.interface = interface
+        self.service = service
+        self._str_cache = None
+
+    interface: Any
+    """Gets the interface that failed creation"""
+    service: str
+    """Gets the service name that failed creation"""
+
+    def __reduce__(self):
+        # args only holds message and extra args; interface and service are needed to rebuild.
+        return (type(self), (self.interface, self.service, *self.args))
 
     def __str__(self) -> str:
-        try:
-            interface_name = self.args[0].__pyunointerface__
-        except AttributeError:
-            interface_name = "Unknown Interface"
-        return f"Unable to create instance for service '{self.args[1]}' with interface of '{interface_name}'.\n{self.args[2]}"
+        if self._str_cache is None:
+            interface_name = getattr(self.interface, "__pyunointerface__", "Unknown Interface")
+            message = self.args[0]
+            if message is None:
+                message = f"Unable to create instance of {self.service}"
+            self._str_cache = (
+                f"Unable to create instance for service '{self.service}' with interface of '{interface_name}'.\n{message}"
+            )
+        return self._str_cache
 
 class CreateInstanceMsfError(CreateInstanceError):
     """Create MSF Instance Error"""
-    pass
+    __slots__ = ()
 
 class CreateInstanceMcfError(CreateInstanceError):
     """Create MCF Instance Error"""
-    pass
+    __slots__ = ()
 
 class CancelEventError(Exception):
     """Error when an Event is canceled"""
 
+    __slots__ = ("_str_cache",)
+
     def __init__(self, event_args: EventArgs, message: Any = None, *args) -> None:
         """
         Cancel Event Error constructor
 
         Args:
             event_args (EventArgs): Event args that was canceled
-            message (Any, optional): Message of error
+            message (Any, optional): Message of error.
+                If omitted, ``args`` holds ``None`` in its place and a default message is built by ``str()``.
         """
-        if message is None:
-            message = f"Event '{event_args.event_name}' is canceled!"
         super().__init__(event_args, message, *args)
+        self._str_cache = None
 
     def __str__(self) -> str:
-        return repr(self.args[1])
+        if self._str_cache is None:
+            message = self.args[1]
+            if message is None:
+                message = f"Event '{self.args[0].event_name}' is canceled!"
+            self._str_cache = repr(message)
+        return self._str_cache
 
 class CursorError(Exception):
     """Handles Cursor errors"""
-    pass
+    __slots__ = ()
 
 class WordCursorError(CursorError):
     """Handles Word Cursor errors"""
-    pass
+    __slots__ = ()
 
 class LineCursorError(CursorError):
     """Handles Line Cursor errors"""
-    pass
+    __slots__ = ()
 
 class SentenceCursorError(CursorError):
     """Handles Sentence Cursor errors"""
-    pass
+    __slots__ = ()
 
 class ParagraphCursorError(CursorError):
     """Handles Sentence Cursor errors"""
-    pass
+    __slots__ = ()
 
 class PageCursorError(Exception):
     """Handles Page Cursor errors"""
-    pass
+    __slots__ = ()
 
 class ViewCursorError(CursorError):
     """Handles View Cursor errors"""
-    pass
+    __slots__ = ()
 
 class LoNotLoadedError(Exception):
     """Error when accessing Lo before Lo.load_office is called"""
-    pass
\ No newline at end of file
+
+    __slots__ = ()
@@ -492,9 +492,9 @@ class Write(mSel.Selection):
 
         open_file_url = None
         if not mFileIO.FileIO.is_openable(pth):
-            if mLo.Lo.is_url(pth):
-                mLo.Lo.print(f"Treating filename as a URL: '{pth}'")
-                open_file_url = str(pth)
+            if mLo.Lo.is_url(fnm):
+                mLo.Lo.print(f"Treating filename as a URL: '{fnm}'")
+                open_file_url = str(fnm)
             else:
                 raise mEx.UnOpenableError(pth)
         else:
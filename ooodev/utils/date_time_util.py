@@ -2,6 +2,7 @@
 from __future__ import annotations
 import datetime
 import numbers
+import time
 from typing import cast
 from . import lo as mLo
 from com.sun.star.util import DateTime as UnoDateTime
@@ -24,11 +25,10 @@ class DateUtil:
         Returns:
             str: Formatted timestamp such as ``2022-06-19 17:12:38``
         """
-        if tz is not None:
-            dt = datetime.datetime.now(tz)
-        else:
-            dt = datetime.datetime.now()
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
+        if tz is None:
+            # local time, no datetime object needed.
+            return time.strftime("%Y-%m-%d %H:%M:%S")
+        return datetime.datetime.now(tz).strftime("%Y-%m-%d %H:%M:%S")
 
     # region --------------- convert methods ---------------------------
     @staticmethod
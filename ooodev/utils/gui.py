@@ -1,8 +1,9 @@
 # coding: utf-8
 # region Imports
 from __future__ import annotations
-from logging import exception
-from typing import TYPE_CHECKING, Iterable, overload, Any
+import contextlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Generator, Iterable, List, Tuple, overload, Any
 from enum import Enum
 import uno
 
@@ -29,6 +30,7 @@ from com.sun.star.frame import XLayoutManager
 from com.sun.star.frame import XFrame
 from com.sun.star.frame import XFramesSupplier
 from com.sun.star.frame import XModel
+from com.sun.star.graphic import XGraphicProvider
 from com.sun.star.lang import SystemDependent  # const
 from com.sun.star.lang import XComponent
 from com.sun.star.view import XControlAccess
@@ -37,11 +39,14 @@ from com.sun.star.ui import UIElementType  # const
 from com.sun.star.ui import XImageManager
 from com.sun.star.ui import XUIConfigurationManagerSupplier
 from com.sun.star.ui import XUIConfigurationManager
+from com.sun.star.ui import XUIElement
 
 if TYPE_CHECKING:
     from com.sun.star.frame import XController
-    from com.sun.star.ui import XUIElement
+    from ..events.args.event_args import EventArgs
 
+from ..events.event_singleton import _Events
+from ..events.lo_named_event import LoNamedEvent
 from ..utils import lo as mLo
 from ..utils import props as mProps
 from ..utils import info as mInfo
@@ -59,6 +64,42 @@ from ooo.dyn.view.document_zoom_type import DocumentZoomTypeEnum
 
 SysInfo = m_sys_info.SysInfo
 
+_PRINT_UI_CMDS_KW = {"ui_elem_name": 0, "config_man": 1, "doc": 1}
+"""Keyword to argument position table for GUI.print_ui_cmds()"""
+_PRINT_U_IS_KW = ("doc", "lm")
+"""Keywords accepted by GUI.print_u_is(), in order of precedence"""
+_ZOOM_CMDS = {
+    DocumentZoomTypeEnum.OPTIMAL: "ZoomOptimal",
+    DocumentZoomTypeEnum.PAGE_WIDTH: "ZoomPageWidth",
+    DocumentZoomTypeEnum.ENTIRE_PAGE: "ZoomPage",
+}
+"""Dispatch commands for GUI.zoom()"""
+_SYSTEM_TYPE_FOR_HANDLE = {
+    SysInfo.PlatformEnum.WINDOWS: SystemDependent.SYSTEM_WIN32,
+    SysInfo.PlatformEnum.MAC: SystemDependent.SYSTEM_MAC,
+    SysInfo.PlatformEnum.LINUX: SystemDependent.SYSTEM_XWINDOW,
+}.get(SysInfo.get_platform(), None)
+"""System type passed to getWindowHandle() by GUI.get_window_handle(). None if platform is not supported."""
+_ZERO_PID = (0,) * 8
+"""Process id (tuple of zero's) passed to getWindowHandle() by GUI.get_window_handle()"""
+_UI_ELEM_TYPE_NAMES = {
+    UIElementType.UNKNOWN: "unknown",
+    UIElementType.MENUBAR: "menubar",
+    UIElementType.POPUPMENU: "popup menu",
+    UIElementType.TOOLBAR: "toolbar",
+    UIElementType.STATUSBAR: "status bar",
+    UIElementType.FLOATINGWINDOW: "floating window",
+    UIElementType.PROGRESSBAR: "progress bar",
+    UIElementType.TOOLPANEL: "tool panel",
+    UIElementType.DOCKINGWINDOW: "docking window",
+    UIElementType.COUNT: "count",
+}
+"""UIElementType constant to name table for GUI.get_ui_element_type_str()"""
+_ZOOM_PROPS_CACHE_MAX = 64
+"""Maximum number of zoom property sequences kept by GUI.zoom_value()"""
+_ZOOM_PROPS_CACHE: OrderedDict[Tuple[int, int], tuple] = OrderedDict()
+"""LRU cache of zoom property sequences keyed by ``(zoom type, zoom value)``"""
+
 
 class GUI:
 
@@ -160,6 +201,9 @@ class GUI:
         def __str__(self) -> str:
             return self.value
 
+        def __format__(self, format_spec: str) -> str:
+            return format(self._value_, format_spec)
+
     class SpecialWindows(str, Enum):
         BASIC_IDE = "BASICIDE"
         WELCOME_SCREEN = "WELCOMESCREEN"
@@ -195,6 +239,26 @@ class GUI:
             self.window_file_name: str = ""  # URL of file name
             self.document_type: mLo.Lo.DocType = mLo.Lo.DocType.UNKNOWN  # Writer, Calc, ...
 
+    class ToolBarBatch:
+        """
+        Items buffered by :py:meth:`~.gui.GUI.batch_toolbar_updates`
+        """
+
+        __slots__ = ("items",)
+
+        def __init__(self) -> None:
+            self.items: List[Tuple[str, str]] = []
+
+        def add_item(self, item_name: str, im_fnm: str) -> None:
+            """
+            Adds an item to be inserted at the start of the toolbar.
+
+            Args:
+                item_name (str): item name
+                im_fnm (str): image file path
+            """
+            self.items.append((item_name, im_fnm))
+
     # endregion class Constants
 
     # region ---------------- toolbar addition -------------------------
@@ -210,7 +274,9 @@ class GUI:
         Returns:
             str: A formatted resource string such as ``private:resource/toolbar/zoombar``
         """
-        resource = f"private:resource/toolbar/{name}"
+        resource = _TOOLBAR_RESOURCES.get(name, None)
+        if resource is None:
+            resource = f"private:resource/toolbar/{name}"
         return resource
 
     @classmethod
@@ -224,51 +290,109 @@ class GUI:
             item_name (str): item name
             im_fnm (str): image file path
 
+        Raises:
+            MissingInterfaceError: If a required interface is not present.
+
+        See Also:
+            :py:meth:`~.gui.GUI.batch_toolbar_updates`
+        """
+        cls._add_items_to_toolbar(doc=doc, toolbar_name=toolbar_name, items=((item_name, im_fnm),))
+
+    @classmethod
+    @contextlib.contextmanager
+    def batch_toolbar_updates(cls, doc: XComponent, toolbar_name: str) -> Generator[GUI.ToolBarBatch, None, None]:
+        """
+        Context manager that adds several user-defined icons and commands to the start of the specified toolbar.
+
+        Toolbar settings are fetched and replaced once when the context exits,
+        rather than once per item as with :py:meth:`~.gui.GUI.add_item_to_toolbar`.
+
+        Args:
+            doc (XComponent): office document
+            toolbar_name (str): toolbar name
+
+        Raises:
+            MissingInterfaceError: If a required interface is not present.
+
+        Yields:
+            Generator[GUI.ToolBarBatch, None, None]: batch to add items to.
+
+        Example:
+
+            .. code::
+
+                with GUI.batch_toolbar_updates(doc, GUI.TOOL_BAR) as batch:
+                    batch.add_item(item_name="Undo", im_fnm="undo.png")
+                    batch.add_item(item_name="Redo", im_fnm="redo.png")
         """
-        from com.sun.star.graphic import XGraphicProvider
+        batch = GUI.ToolBarBatch()
+        yield batch
+        if len(batch.items) > 0:
+            cls._add_items_to_toolbar(doc=doc, toolbar_name=toolbar_name, items=batch.items)
 
-        def load_graphic_file(im_fnm: str):
-            # this method is also in Images module.
-            # images module currently does not run as macro.
-            # Pillow not needed for this method so make it local
+    @classmethod
+    def _get_graphic_provider(cls) -> XGraphicProvider | None:
+        # Graphic provider is an office wide service. Created once and cleared on office reset.
+        try:
+            return cls._graphic_provider
+        except AttributeError:
             gprovider = mLo.Lo.create_instance_mcf(XGraphicProvider, "com.sun.star.graphic.GraphicProvider")
             if gprovider is None:
                 return None
+            cls._graphic_provider = gprovider
+        return cls._graphic_provider
 
-            file_props = mProps.Props.make_props(URL=mFileIO.FileIO.fnm_to_url(im_fnm))
-            return gprovider.queryGraphic(file_props)
+    @classmethod
+    def _load_graphic_file(cls, im_fnm: str):
+        # this method is also in Images module.
+        # images module currently does not run as macro.
+        # Pillow not needed for this method so keep it here
+        gprovider = cls._get_graphic_provider()
+        if gprovider is None:
+            return None
 
-        try:
-            cmd = mLo.Lo.make_uno_cmd(item_name)
-            conf_man: XUIConfigurationManager = cls.get_ui_config_manager_doc(doc)
-            image_man = mLo.Lo.qi(XImageManager, conf_man.getImageManager())
-            if image_man is None:
-                raise mEx.MissingInterfaceError(XImageManager)
-            cmds = (cmd,)
-            img = load_graphic_file(im_fnm)
+        file_props = mProps.Props.make_props(URL=mFileIO.FileIO.fnm_to_url(im_fnm))
+        return gprovider.queryGraphic(file_props)
+
+    @classmethod
+    def _add_items_to_toolbar(cls, doc: XComponent, toolbar_name: str, items: Iterable[Tuple[str, str]]) -> None:
+        cmds = []
+        pics = []
+        names = []
+        for item_name, im_fnm in items:
+            img = cls._load_graphic_file(im_fnm)
             if img is None:
                 mLo.Lo.print(f"Unable to load graphics file: '{im_fnm}'")
-                return
-            pics = (img,)
-            image_man.insertImages(0, cmds, pics)
-
-            # add item to toolbar
-            settings = conf_man.getSettings(toolbar_name, True)
-            con_settings = mLo.Lo.qi(XIndexContainer, settings)
-            if con_settings is None:
-                raise mEx.MissingInterfaceError(XIndexContainer)
-            item_props = mProps.Props.make_bar_item(cmd, item_name)
-            con_settings.insertByIndex(0, item_props)
-            conf_man.replaceSettings(toolbar_name, con_settings)
-        except Exception as e:
-            mLo.Lo.print(e)
+                continue
+            cmds.append(mLo.Lo.make_uno_cmd(item_name))
+            pics.append(img)
+            names.append(item_name)
+        if len(cmds) == 0:
+            return
+
+        conf_man: XUIConfigurationManager = cls.get_ui_config_manager_doc(doc)
+        image_man = mLo.Lo.qi(XImageManager, conf_man.getImageManager())
+        if image_man is None:
+            raise mEx.MissingInterfaceError(XImageManager)
+        image_man.insertImages(0, tuple(cmds), tuple(pics))
+
+        # add items to toolbar.
+        # settings are fetched fresh each call so changes made elsewhere are not overwritten.
+        settings = conf_man.getSettings(toolbar_name, True)
+        con_settings = mLo.Lo.qi(XIndexContainer, settings)
+        if con_settings is None:
+            raise mEx.MissingInterfaceError(XIndexContainer)
+        for cmd, item_name in zip(cmds, names):
+            # each item goes to the start of the toolbar, same as repeated calls to add_item_to_toolbar()
+            con_settings.insertByIndex(0, mProps.Props.make_bar_item(cmd, item_name))
+        conf_man.replaceSettings(toolbar_name, con_settings)
 
     # endregion ------------- toolbar addition -------------------------
 
     # region ---------------- floating frame, message box --------------
 
-    @staticmethod
-    def create_floating_frame(title: str, x: int, y: int, width: int, height: int) -> XFrame:
+    @classmethod
+    def create_floating_frame(cls, title: str, x: int, y: int, width: int, height: int) -> XFrame:
         """
         Create a floating XFrame at the given position and size
 
@@ -285,18 +409,16 @@ class GUI:
         Returns:
             XFrame: Floating frame
         """
-        xtoolkit = mLo.Lo.create_instance_mcf(XToolkit, "com.sun.star.awt.Toolkit")
-        if xtoolkit is None:
-            raise mEx.MissingInterfaceError(XToolkit)
+        xtoolkit = cls._get_toolkit()
         desc = WindowDescriptor(Type=WindowClass.TOP, WindowServiceName="modelessdialog", ParentIndex=-1)
 
         desc.Bounds = Rectangle(x, y, width, height)
         desc.WindowAttributes = (
             WindowAttribute.BORDER
-            + WindowAttribute.MOVEABLE
-            + WindowAttribute.CLOSEABLE
-            + WindowAttribute.SIZEABLE
-            + VclWindowPeerAttribute.CLIPCHILDREN
+            | WindowAttribute.MOVEABLE
+            | WindowAttribute.CLOSEABLE
+            | WindowAttribute.SIZEABLE
+            | VclWindowPeerAttribute.CLIPCHILDREN
         )
 
         xwindow_peer = xtoolkit.createWindow(desc)
@@ -336,13 +458,13 @@ class GUI:
         Raises:
             MissingInterfaceError: If required interface is not present.
         """
-        xtoolkit = mLo.Lo.create_instance_mcf(XToolkit, "com.sun.star.awt.Toolkit")
         xwindow = cls.get_window()
-        if xtoolkit is None or xwindow is None:
+        if xwindow is None:
             return None
         xpeer = mLo.Lo.qi(XWindowPeer, xwindow)
         if xpeer is None:
             raise mEx.MissingInterfaceError(XWindowPeer)
+        xtoolkit = cls._get_toolkit()
         desc = WindowDescriptor(
             Type=WindowClass.MODALTOP,
             WindowServiceName="infobox",
@@ -353,13 +475,12 @@ class GUI:
         )
 
         desc_peer = xtoolkit.createWindow(desc)
-        if desc_peer is None:
-            msg_box = mLo.Lo.qi(XMessageBox, desc_peer)
-            if msg_box is None:
-                raise mEx.MissingInterfaceError(XMessageBox)
-            msg_box.CaptionText = title
-            msg_box.MessageText = message
-            msg_box.execute()
+        msg_box = mLo.Lo.qi(XMessageBox, desc_peer)
+        if msg_box is None:
+            raise mEx.MissingInterfaceError(XMessageBox)
+        msg_box.CaptionText = title
+        msg_box.MessageText = message
+        msg_box.execute()
 
     @staticmethod
     def get_password(title: str, input_msg: str) -> str:
@@ -385,6 +506,26 @@ class GUI:
         # in original java this was done by creating a input box with a password field
         # this could likely be done with LibreOffice API, create input box and set input as password field
 
+    @classmethod
+    def _get_toolkit(cls) -> XToolkit:
+        # Toolkit is a single office wide service. Created once and cleared on office reset.
+        try:
+            return cls._toolkit
+        except AttributeError:
+            try:
+                cls._toolkit = mLo.Lo.create_instance_mcf(XToolkit, "com.sun.star.awt.Toolkit", raise_err=True)
+            except mEx.CreateInstanceMcfError as e:
+                raise mEx.MissingInterfaceError(XToolkit) from e
+        return cls._toolkit
+
+    @classmethod
+    def _get_ext_toolkit(cls) -> XExtendedToolkit:
+        try:
+            return cls._ext_toolkit
+        except AttributeError:
+            cls._ext_toolkit = mLo.Lo.qi(XExtendedToolkit, cls._get_toolkit(), True)
+        return cls._ext_toolkit
+
     # endregion ------------- floating frame, message box --------------
 
     # region ---------------- controller and frame ---------------------
@@ -403,12 +544,9 @@ class GUI:
         Returns:
             XController: controller
         """
-        doc = mLo.Lo.qi(XComponent, odoc)
-        if doc is None:
-            raise mEx.MissingInterfaceError(XComponent)
-        model = mLo.Lo.qi(XModel, doc)
+        model = mLo.Lo.qi(XModel, odoc)
         if model is None:
-            raise mEx.MissingInterfaceError(XComponent)
+            raise mEx.MissingInterfaceError(XModel)
         return model.getCurrentController()
 
     @classmethod
@@ -472,16 +610,13 @@ class GUI:
             odoc (object): office document
 
         Raises:
-            MissingInterfaceError: if odoc does not implement XComponent interface.
+            MissingInterfaceError: if odoc does not implement XModel interface.
             MissingInterfaceError: if XSelectionSupplier interface instance is not obtained.
 
         Returns:
             XSelectionSupplier: Selection supplier
         """
-        doc = mLo.Lo.qi(XComponent, odoc)
-        if doc is None:
-            raise mEx.MissingInterfaceError(XComponent, "Not an office document")
-        xcontroler = cls.get_current_controller(doc)
+        xcontroler = cls.get_current_controller(odoc)
         result = mLo.Lo.qi(XSelectionSupplier, xcontroler)
         if result is None:
             raise mEx.MissingInterfaceError(XSelectionSupplier)
@@ -540,7 +675,7 @@ class GUI:
             mLo.Lo.print(f"  {e}")
             return win
         if implementation == "com.sun.star.comp.basic.BasicIDE":
-            win.window_name = str(GUI.SpecialWindows.BASIC_IDE)
+            win.window_name = GUI.SpecialWindows.BASIC_IDE.value
         elif implementation == "com.sun.star.comp.dba.ODatabaseDocument":  # No identifier
             model = mLo.Lo.qi(XModel, obj, True)
             win.window_file_name = str(mProps.Props.get_value(name="URL", props=model.getArgs()))
@@ -555,7 +690,7 @@ class GUI:
             "com.sun.star.comp.sfx2.BackingComp",
         ):
             win.frame = component.Frame
-            win.window_name = str(GUI.SpecialWindows.WELCOME_SCREEN)
+            win.window_name = GUI.SpecialWindows.WELCOME_SCREEN.value
         else:
             if len(identifier) > 0:
                 # Do not use URL : it contains the TemplateFile when new documents are created from a template
@@ -735,10 +870,10 @@ class GUI:
         if odoc is None:
             xwindow = cls.get_window()
         else:
-            doc = mLo.Lo.qi(XComponent, odoc)
-            if doc is None:
+            model = mLo.Lo.qi(XModel, odoc)
+            if model is None:
                 return
-            xwindow = cls.get_frame(doc).getContainerWindow()
+            xwindow = model.getCurrentController().getFrame().getContainerWindow()
 
         if xwindow is not None:
             xwindow.setVisible(is_visible)
@@ -787,8 +922,8 @@ class GUI:
         xwindow = cls.get_window(doc)
         return xwindow.getPosSize()
 
-    @staticmethod
-    def get_top_window() -> XTopWindow:
+    @classmethod
+    def get_top_window(cls) -> XTopWindow:
         """
         Gets top window
 
@@ -799,9 +934,7 @@ class GUI:
         Returns:
             XTopWindow: top window
         """
-        tk = mLo.Lo.create_instance_mcf(XExtendedToolkit, "com.sun.star.awt.Toolkit")
-        if tk is None:
-            raise mEx.MissingInterfaceError(XExtendedToolkit)
+        tk = cls._get_ext_toolkit()
         top_win = tk.getActiveTopWindow()
         if top_win is None:
             raise mEx.MissingInterfaceError(XTopWindow)
@@ -828,8 +961,8 @@ class GUI:
             raise mEx.MissingInterfaceError(XAccessibleContext)
         return acc_content.getAccessibleName()
 
-    @staticmethod
-    def get_screen_size() -> Rectangle:
+    @classmethod
+    def get_screen_size(cls) -> Rectangle:
         """
         Get the work area as Rectangle
 
@@ -848,9 +981,7 @@ class GUI:
         See also:
             `Toolkit <https://api.libreoffice.org/docs/idl/ref/servicecom_1_1sun_1_1star_1_1awt_1_1Toolkit.html>`_
         """
-        tk = mLo.Lo.create_instance_mcf(XToolkit, "com.sun.star.awt.Toolkit")
-        if tk is None:
-            raise mEx.MissingInterfaceError(XToolkit)
+        tk = cls._get_toolkit()
         return tk.getWorkArea()
 
     @staticmethod
@@ -882,18 +1013,10 @@ class GUI:
         """
         win = cls.get_window(doc)
         win_peer = mLo.Lo.qi(XSystemDependentWindowPeer, win)
-        pid = tuple([0 for _ in range(8)])  # tuple of zero's
-        info = SysInfo.get_platform()
-        if info == SysInfo.PlatformEnum.WINDOWS:
-            system_type = SystemDependent.SYSTEM_WIN32
-        elif info == SysInfo.PlatformEnum.MAC:
-            system_type = SystemDependent.SYSTEM_MAC
-        elif info == SysInfo.PlatformEnum.LINUX:
-            system_type = SystemDependent.SYSTEM_XWINDOW
-        else:
+        if _SYSTEM_TYPE_FOR_HANDLE is None:
             mLo.Lo.print("Unable to support, don't know this system.")
             return None
-        handel = int(win_peer.getWindowHandle(pid, system_type))
+        handel = int(win_peer.getWindowHandle(_ZERO_PID, _SYSTEM_TYPE_FOR_HANDLE))
         return handel
 
     @staticmethod
@@ -967,23 +1090,21 @@ class GUI:
     # region ---------------- zooming ----------------------------------
 
     @classmethod
-    def zoom(cls, view: GUI.ZoomEnum) -> None:
+    def zoom(cls, view: GUI.ZoomEnum, delay: int = 500) -> None:
         """
         Sets document zoom level.
 
         Args:
             view (ZoomEnum): Zoom value
+            delay (int, optional): Milliseconds to wait after zoom command is dispatched. Defaults to ``500``.
         """
-        if view == cls.ZoomEnum.OPTIMAL:
-            mLo.Lo.dispatch_cmd("ZoomOptimal")
-        elif view == cls.ZoomEnum.PAGE_WIDTH:
-            mLo.Lo.dispatch_cmd("ZoomPageWidth")
-        elif view == cls.ZoomEnum.ENTIRE_PAGE:
-            mLo.Lo.dispatch_cmd("ZoomPage")
-        else:
+        cmd = _ZOOM_CMDS.get(view, None)
+        if cmd is None:
             mLo.Lo.print(f"Did not recognize zoom view: {view}; using optimal")
-            mLo.Lo.dispatch_cmd("ZoomOptimal")
-        mLo.Lo.delay(500)
+            cmd = "ZoomOptimal"
+        mLo.Lo.dispatch_cmd(cmd)
+        if delay > 0:
+            mLo.Lo.delay(delay)
 
     @overload
     @classmethod
@@ -996,6 +1117,18 @@ class GUI:
         """
         ...
 
+    @overload
+    @classmethod
+    def zoom_value(cls, value: int, *, delay: int) -> None:
+        """
+        Sets document custom zoom.
+
+        Args:
+            value (int): The amount to zoom. :abbreviation:`eg:` 160 zooms 160%
+            delay (int): Milliseconds to wait after zoom command is dispatched.
+        """
+        ...
+
     @overload
     @classmethod
     def zoom_value(cls, value: int, view: GUI.ZoomEnum) -> None:
@@ -1008,23 +1141,44 @@ class GUI:
         """
         ...
 
+    @overload
     @classmethod
-    def zoom_value(cls, value: int, view: GUI.ZoomEnum = ZoomEnum.BY_VALUE) -> None:
+    def zoom_value(cls, value: int, view: GUI.ZoomEnum, delay: int) -> None:
         """
         Sets document custom zoom.
 
         Args:
             value (int): The amount to zoom. :abbreviation:`eg:` 160 zooms 160%
             view (ZoomEnum): Type of zoom. If ``view`` is not ``ZoomEnum.BY_VALUE`` then ``value`` is ignored. Defaults to ``ZoomEnum.BY_VALUE``.
+            delay (int): Milliseconds to wait after zoom command is dispatched.
         """
-        # https://wiki.openoffice.org/wiki/Documentation/DevGuide/Drawings/Zooming
-        p_dic = {"Zoom.Value": 0, "Zoom.ValueSet": 28703, "Zoom.Type": int(view)}
-        if view == cls.ZoomEnum.BY_VALUE:
-            p_dic["Zoom.Value"] = value
+        ...
+
+    @classmethod
+    def zoom_value(cls, value: int, view: GUI.ZoomEnum = ZoomEnum.BY_VALUE, delay: int = 500) -> None:
+        """
+        Sets document custom zoom.
 
-        props = mProps.Props.make_props(**p_dic)
+        Args:
+            value (int): The amount to zoom. :abbreviation:`eg:` 160 zooms 160%
+            view (ZoomEnum): Type of zoom. If ``view`` is not ``ZoomEnum.BY_VALUE`` then ``value`` is ignored. Defaults to ``ZoomEnum.BY_VALUE``.
+            delay (int, optional): Milliseconds to wait after zoom command is dispatched. Defaults to ``500``.
+        """
+        # https://wiki.openoffice.org/wiki/Documentation/DevGuide/Drawings/Zooming
+        zoom_type = int(view)
+        zoom_val = value if view == cls.ZoomEnum.BY_VALUE else 0
+        key = (zoom_type, zoom_val)
+        props = _ZOOM_PROPS_CACHE.get(key, None)
+        if props is None:
+            props = mProps.Props.make_props(**{"Zoom.Value": zoom_val, "Zoom.ValueSet": 28703, "Zoom.Type": zoom_type})
+            _ZOOM_PROPS_CACHE[key] = props
+            if len(_ZOOM_PROPS_CACHE) > _ZOOM_PROPS_CACHE_MAX:
+                _ZOOM_PROPS_CACHE.popitem(last=False)
+        else:
+            _ZOOM_PROPS_CACHE.move_to_end(key)
         mLo.Lo.dispatch_cmd(cmd="Zoom", props=props)
-        mLo.Lo.delay(500)
+        if delay > 0:
+            mLo.Lo.delay(delay)
 
     # endregion ------------- zooming ----------------------------------
 
@@ -1118,38 +1272,22 @@ class GUI:
             config_man (XUIConfigurationManager): configuration manager
             doc (XComponent): office document
         """
-        ordered_keys = (1, 2)
-        kargs_len = len(kwargs)
-        count = len(args) + kargs_len
-
-        def get_kwargs() -> dict:
-            ka = {}
-            if kargs_len == 0:
-                return ka
-            valid_keys = ("ui_elem_name", "config_man", "doc")
-            check = all(key in valid_keys for key in kwargs.keys())
-            if not check:
-                raise TypeError("print_ui_cmds() got an unexpected keyword argument")
-            ka[1] = kwargs.get("ui_elem_name", None)
-            keys = ("config_man", "doc")
-            for key in keys:
-                if key in kwargs:
-                    ka[2] = kwargs[key]
-                    break
-            return ka
-
-        if count != 2:
+        if len(args) + len(kwargs) != 2:
             raise TypeError("print_ui_cmds() got an invalid number of arguments")
-
-        kargs = get_kwargs()
-
-        for i, arg in enumerate(args):
-            kargs[ordered_keys[i]] = arg
-        obj = mLo.Lo.qi(XUIConfigurationManager, kargs[2])
+        kargs = dict(enumerate(args))
+        for key, value in kwargs.items():
+            pos = _PRINT_UI_CMDS_KW.get(key, None)
+            if pos is None:
+                raise TypeError(f"print_ui_cmds() got an unexpected keyword argument '{key}'")
+            if pos in kargs:
+                raise TypeError(f"print_ui_cmds() got multiple values for argument '{key}'")
+            kargs[pos] = value
+
+        obj = mLo.Lo.qi(XUIConfigurationManager, kargs[1])
         if obj is None:
-            cls._print_ui_cmds2(ui_elem_name=kargs[1], doc=kargs[2])
+            cls._print_ui_cmds2(ui_elem_name=kargs[0], doc=kargs[1])
         else:
-            cls._print_ui_cmds1(ui_elem_name=kargs[1], config_man=kargs[2])
+            cls._print_ui_cmds1(ui_elem_name=kargs[0], config_man=kargs[1])
 
     @staticmethod
     def _print_ui_cmds1(
@@ -1161,16 +1299,22 @@ class GUI:
         try:
             settings = config_man.getSettings(ui_elem_name, True)
             num_settings = settings.getCount()
-            print(f"No. of slements in '{ui_elem_name}' toolbar: {num_settings}")
+            lines = [f"No. of slements in '{ui_elem_name}' toolbar: {num_settings}"]
 
+            get_by_index = settings.getByIndex
+            to_str = mProps.Props.prop_value_to_string
+            add_line = lines.append
             for i in range(num_settings):
                 # line from java
                 # PropertyValue[] settingProps =  Lo.qi(PropertyValue[].class, settings.getByIndex(i));
-                setting_props = mLo.Lo.qi(XPropertySet, settings.getByIndex(i))
-                val = mProps.Props.get_value(name="CommandURL", props=setting_props)
-                print(f"{i}) {mProps.Props.prop_value_to_string(val)}")
-            print()
-        except exception as e:
+                # in python getByIndex() already returns a tuple of PropertyValue, no query needed.
+                for pv in get_by_index(i):
+                    if pv.Name == "CommandURL":
+                        add_line(f"{i}) {to_str(pv.Value)}")
+                        break
+            # one write for the whole listing
+            print("\n".join(lines), end="\n\n")
+        except Exception as e:
             print(e)
 
     @classmethod
@@ -1179,7 +1323,7 @@ class GUI:
         if config_man is None:
             print("Cannot create configuration manager")
             return
-        cls.print_ui_cmds()
+        cls._print_ui_cmds1(ui_elem_name=ui_elem_name, config_man=config_man)
 
     # endregion print_ui_cmds()
 
@@ -1243,9 +1387,12 @@ class GUI:
             if frame is None:
                 raise Exception("No current frame")
 
-            lm = None
-            prop_set = mLo.Lo.qi(XPropertySet, frame)
-            lm = mLo.Lo.qi(XLayoutManager, prop_set.getPropertyValue("LayoutManager"))
+            # pyuno exposes frame properties as attributes, one bridge call instead of qi + getPropertyValue
+            olm = getattr(frame, "LayoutManager", None)
+            if olm is None:
+                prop_set = mLo.Lo.qi(XPropertySet, frame, True)
+                olm = prop_set.getPropertyValue("LayoutManager")
+            lm = mLo.Lo.qi(XLayoutManager, olm)
             if lm is None:
                 raise mEx.MissingInterfaceError(XLayoutManager)
             return lm
@@ -1292,34 +1439,27 @@ class GUI:
             lm (XLayoutManager): Layout manager
             doc (XComponent): office document
         """
-        ordered_keys = ("first",)
-        kargs = {}
-        if "doc" in kwargs:
-            kargs["first"] = kwargs["doc"]
-        elif "lm" in kwargs:
-            kargs["first"] = kwargs["lm"]
-        for i, arg in enumerate(args):
-            kargs[ordered_keys[i]] = arg
-        k_len = len(kargs)
-        if k_len > 1:
+        if len(args) > 1 or (args and kwargs):
             print("invalid number of arguments for print_u_is()")
             return
-        if k_len == 0:
+        if args:
+            first = args[0]
+        else:
+            first = next((kwargs[key] for key in _PRINT_U_IS_KW if key in kwargs), None)
+        if first is None:
             lm = cls.get_layout_manager()
         else:
-            obj = mLo.Lo.qi(XLayoutManager, kargs["first"])
-            if obj is None:
-                lm = cls.get_layout_manager(kargs["first"])
-            else:
-                lm = kargs["first"]
+            lm = mLo.Lo.qi(XLayoutManager, first)
+            if lm is None:
+                lm = cls.get_layout_manager(first)
         if lm is None:
             print("No layout manager found")
             return
-        ui_elems = lm.getElements()
-        print(f"No. of UI Elemtnts: {len(ui_elems)}")
-        for el in ui_elems:
-            print(f"  {el.ResourceURL}; {cls.get_ui_element_type_str(el.Type)}")
-        print()
+        type_str = cls.get_ui_element_type_str
+        lines = [f"  {el.ResourceURL}; {type_str(el.Type)}" for el in lm.getElements()]
+        lines.insert(0, f"No. of UI Elemtnts: {len(lines)}")
+        # one write for the whole listing
+        print("\n".join(lines), end="\n\n")
 
     # endregion print_u_is()
 
@@ -1343,28 +1483,10 @@ class GUI:
         """
         if not isinstance(t, int):
             raise TypeError("'t' is not an int")
-        if t == UIElementType.UNKNOWN:
-            return "unknown"
-        if t == UIElementType.MENUBAR:
-            return "menubar"
-        if t == UIElementType.POPUPMENU:
-            return "popup menu"
-        if t == UIElementType.TOOLBAR:
-            return "toolbar"
-        if t == UIElementType.STATUSBAR:
-            return "status bar"
-        if t == UIElementType.FLOATINGWINDOW:
-            return "floating window"
-        if t == UIElementType.PROGRESSBAR:
-            return "progress bar"
-        if t == UIElementType.TOOLPANEL:
-            return "tool panel"
-        if t == UIElementType.DOCKINGWINDOW:
-            return "docking window"
-        if t == UIElementType.COUNT:
-            return "count"
-
-        raise ValueError("'t' is is not a valid UIElementType value")
+        try:
+            return _UI_ELEM_TYPE_NAMES[t]
+        except KeyError:
+            raise ValueError("'t' is is not a valid UIElementType value") from None
 
     @classmethod
     def printAllUICommands(cls, doc: XComponent) -> None:
@@ -1382,10 +1504,10 @@ class GUI:
         if lm is None:
             print("No layout manager found")
             return
-        ui_elmes = lm.getElements()
-        print(f"No. of UI Elements: {len(ui_elmes)}")
-        for el in ui_elmes:
-            name = el.ResourceURL
+        # read resource names once so the loop below does not touch element proxies
+        names = [el.ResourceURL for el in lm.getElements()]
+        print(f"No. of UI Elements: {len(names)}")
+        for name in names:
             print(f"--- {name} ---")
             cls._print_ui_cmds1(ui_elem_name=name, config_man=conf_man)
 
@@ -1398,8 +1520,7 @@ class GUI:
             doc (XComponent): office document
             show_elem (str): name of element to show only.
         """
-        show_elems = [show_elem]
-        cls.show_only(doc=doc, show_elems=[show_elems])
+        cls.show_only(doc=doc, show_elems=(show_elem,))
 
     @classmethod
     def show_only(cls, doc: XComponent, show_elems: Iterable[str]) -> None:
@@ -1413,38 +1534,50 @@ class GUI:
             doc (XComponent): office document
             show_elems (Iterable[str]): Elements to show
         """
+        names = tuple(show_elems)
+        if len(names) == 0:
+            # nothing to show, same as hiding everything
+            cls.show_none(doc)
+            return
         lm = cls.get_layout_manager(doc)
         ui_elmes = lm.getElements()
-        cls.hide_except(lm=lm, ui_elms=ui_elmes, show_elems=show_elems)
+        not_found = cls.hide_except(lm=lm, ui_elms=ui_elmes, show_elms=names)
 
-        for el_name in show_elems:  # these elems are not in lm
+        for el_name in not_found:  # these elems are not in lm
             lm.createElement(el_name)  # so need to be created & shown
             lm.showElement(el_name)
             mLo.Lo.print(f"{el_name} made visible")
 
     @staticmethod
-    def hide_except(lm: XLayoutManager, ui_elms: Iterable[XUIElement], show_elms: Iterable[str]) -> None:
+    def hide_except(lm: XLayoutManager, ui_elms: Iterable[XUIElement], show_elms: Iterable[str]) -> List[str]:
         """
-        Hide all of ``ui_elms``, except ones in ``show_elms``;
-        delete any strings that match in ``show_elms``.
+        Hide all of ``ui_elms``, except ones in ``show_elms``.
 
         Args:
             lm (XLayoutManager): Layout Manager
             ui_elms (Iterable[XUIElement]): Elements
             show_elms (Iterable[str]): elements to show
+
+        Returns:
+            List[str]: Names in ``show_elms`` that did not match any of ``ui_elms``, in their original order.
+            Duplicate names are only returned once.
+
+        Note:
+            ``show_elms`` is not modified. Use the returned list to get the names that were not found.
         """
+        # ordered set, show_elms is not modified
+        remaining = dict.fromkeys(show_elms)
+        hidden = []
         for ui_elm in ui_elms:
             el_name = ui_elm.ResourceURL
-            to_hide = True
-            # show_elms_lst = list(show_elms)
-            for el in show_elms:
-                if el == el_name:
-                    show_elms.remove(el)  # this elem is in lm so remove from show_elems
-                    to_hide = False
-                    break
-            if to_hide:
+            if el_name in remaining:
+                del remaining[el_name]  # this elem is in lm so it is not left to show
+            else:
                 lm.hideElement(el_name)
-                mLo.Lo.print(f"{el_name} hidden")
+                hidden.append(f"{el_name} hidden")
+        if hidden:
+            mLo.Lo.print("\n".join(hidden))
+        return list(remaining)
 
     @classmethod
     def show_none(cls, doc: XComponent) -> None:
@@ -1461,11 +1594,13 @@ class GUI:
         if lm is None:
             mLo.Lo.print("No layout manager found")
             return
-        ui_elms = lm.getElements()
-        for ui_elm in ui_elms:
-            elem_name = ui_elm.ResourceURL
-            lm.hideElement(elem_name)
-            mLo.Lo.print(f"{elem_name} hidden")
+        hide = lm.hideElement
+        hidden = []
+        for elem_name in [ui_elm.ResourceURL for ui_elm in lm.getElements()]:
+            hide(elem_name)
+            hidden.append(f"{elem_name} hidden")
+        if hidden:
+            mLo.Lo.print("\n".join(hidden))
 
     # endregion ------------- layout manager ---------------------------
 
@@ -1490,14 +1625,17 @@ class GUI:
             raise TypeError("'lm' is None. No layout manager available for menu discovery")
 
         omenu_bar = lm.getElement(cls.MENU_BAR)
+        if omenu_bar is None:
+            raise mEx.MissingInterfaceError(XUIElement, "Menu bar element not found")
         props = mLo.Lo.qi(XPropertySet, omenu_bar)
-        if bar is None:
+        if props is None:
             raise mEx.MissingInterfaceError(XPropertySet)
 
         bar = mLo.Lo.qi(XMenuBar, props.getPropertyValue("XMenuBar"))
         # the XMenuBar reference is a property of the menubar UI
         if bar is None:
             raise mEx.MissingInterfaceError(XMenuBar)
+        return bar
 
     @classmethod
     def get_menu_max_id(cls, bar: XMenuBar) -> int:
@@ -1514,13 +1652,23 @@ class GUI:
         if bar is None:
             return -1
 
-        item_count = bar.getItemCount()
-        max_id = -1
-        for i in range(item_count):
-            id = bar.getItemId(i)
-            if id > max_id:
-                max_id = id
-
-        return max_id
+        get_id = bar.getItemId
+        return max((get_id(i) for i in range(bar.getItemCount())), default=-1)
 
     # endregion ------------- menu bar ---------------------------------
+
+
+# resource strings for known toolbars, computed once. Used by GUI.get_toobar_resource()
+_TOOLBAR_RESOURCES = {name.value: f"private:resource/toolbar/{name.value}" for name in GUI.ToolBarName}
+
+
+def _del_cache_attrs(source: object, e: EventArgs) -> None:
+    # clears GUI Attributes that are dynamically created
+    dattrs = ("_toolkit", "_ext_toolkit", "_graphic_provider")
+    for attr in dattrs:
+        if hasattr(GUI, attr):
+            delattr(GUI, attr)
+
+
+# subscribe to events that warrant clearing cached attribs
+_Events().on(LoNamedEvent.RESET, _del_cache_attrs)
@@ -732,28 +732,26 @@ class Info(metaclass=StaticProperty):
         Returns:
             Lo.DocType: Document type.
         """
-        doc_type = mLo.Lo.DocType.UNKNOWN
-        if cls.is_doc_type(obj=doc, doc_type=mLo.Lo.Service.WRITER):
-            mLo.Lo.print("A Writer document")
-            doc_type = mLo.Lo.DocType.WRITER
-        elif cls.is_doc_type(obj=doc, doc_type=mLo.Lo.Service.IMPRESS):
-            mLo.Lo.print("A Impress document")
-            doc_type = mLo.Lo.DocType.IMPRESS
-        elif cls.is_doc_type(obj=doc, doc_type=mLo.Lo.Service.DRAW):
-            mLo.Lo.print("A Draw document")
-            doc_type = mLo.Lo.DocType.DRAW
-        elif cls.is_doc_type(obj=doc, doc_type=mLo.Lo.Service.CALC):
-            mLo.Lo.print("A Calc document")
-            doc_type = mLo.Lo.DocType.CALC
-        elif cls.is_doc_type(obj=doc, doc_type=mLo.Lo.Service.BASE):
-            mLo.Lo.print("A Base document")
-            doc_type = mLo.Lo.DocType.BASE
-        elif cls.is_doc_type(obj=doc, doc_type=mLo.Lo.Service.MATH):
-            mLo.Lo.print("A Math document")
-            doc_type = mLo.Lo.DocType.MATH
-        else:
-            mLo.Lo.print("Unknown document")
-        return doc_type
+        # query service info once and test each service in turn, first match wins.
+        si = mLo.Lo.qi(XServiceInfo, doc)
+        if si is not None:
+            for service, doc_type, name in (
+                (mLo.Lo.Service.WRITER, mLo.Lo.DocType.WRITER, "Writer"),
+                (mLo.Lo.Service.IMPRESS, mLo.Lo.DocType.IMPRESS, "Impress"),
+                (mLo.Lo.Service.DRAW, mLo.Lo.DocType.DRAW, "Draw"),
+                (mLo.Lo.Service.CALC, mLo.Lo.DocType.CALC, "Calc"),
+                (mLo.Lo.Service.BASE, mLo.Lo.DocType.BASE, "Base"),
+                (mLo.Lo.Service.MATH, mLo.Lo.DocType.MATH, "Math"),
+            ):
+                try:
+                    supported = si.supportsService(str(service))
+                except Exception:
+                    supported = False
+                if supported:
+                    mLo.Lo.print(f"A {name} document")
+                    return doc_type
+        mLo.Lo.print("Unknown document")
+        return mLo.Lo.DocType.UNKNOWN
 
     @classmethod
     def doc_type_service(cls, doc: object) -> mLo.Lo.Service:
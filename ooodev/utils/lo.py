@@ -5,10 +5,10 @@
 from __future__ import annotations
 from ast import Not
 from datetime import datetime, timezone
+import re
 import time
 import types
 from typing import TYPE_CHECKING, Any, Iterable, Optional, List, Tuple, cast, overload, Type
-from urllib.parse import urlparse
 import uno
 from enum import IntEnum, Enum
 
@@ -35,6 +35,7 @@ from com.sun.star.lang import XComponent
 # this is also true becuase docs/conf.py ignores com import for autodoc
 from com.sun.star.beans import XPropertySet
 from com.sun.star.beans import XIntrospection
+from com.sun.star.container import XNameAccess
 from com.sun.star.container import XNamed
 from com.sun.star.frame import XDesktop
 from com.sun.star.frame import XDispatchHelper
@@ -79,6 +80,29 @@ from .type_var import PathOrStr, UnoInterface, T
 # PathOrStr = type_var.PathOrStr
 # """Path like object or string"""
 
+_UNO_TYPE_CACHE: dict = {
+    iface: uno.getTypeByName(iface.__pyunointerface__)
+    for iface in (
+        XCloseable,
+        XComponent,
+        XComponentLoader,
+        XDesktop,
+        XModel,
+        XMultiServiceFactory,
+        XNamed,
+        XNumberFormatsSupplier,
+        XPropertySet,
+        XStorable,
+    )
+}
+"""uno Type keyed by interface class, used by Lo.qi(). Types come from the local type manager so are not cleared on office reset."""
+
+_URL_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.\-]*://[^/?#]")
+"""Matches a URL scheme followed by a network location, used by Lo.is_url()"""
+
+_UNO_ITEM_RE = re.compile(r"Foo\.(.*?)\?language")
+"""Captures item name of a command created by Lo.make_uno_cmd(), used by Lo.extract_item_name()"""
+
 
 class Lo(metaclass=StaticProperty):
     class ControllerLock:
@@ -126,6 +150,16 @@ class Lo(metaclass=StaticProperty):
                     doc = Write.create_doc(loader)
                     ...
 
+            Nested loaders can share the connection of an outer loader by passing ``reuse=True``.
+
+            .. code::
+
+                with Lo.Loader(Lo.ConnectSocket()) as loader:
+                    with Lo.Loader(Lo.ConnectSocket(), reuse=True) as inner_loader:
+                        # same office instance as loader, office stays open on exit
+                        doc = Write.create_doc(inner_loader)
+                        ...
+
         See Also:
             :ref:`ch02`
         """
@@ -134,6 +168,7 @@ class Lo(metaclass=StaticProperty):
             self,
             connector: connectors.ConnectPipe | connectors.ConnectSocket | None,
             cache_obj: mCache.Cache | None = None,
+            reuse: bool = False,
         ):
             """
             Create a connection to office
@@ -142,14 +177,24 @@ class Lo(metaclass=StaticProperty):
                 connector (connectors.ConnectPipe | connectors.ConnectSocket | None): Connection information. Ignore for macros.
                 cache_obj (mCache.Cache | None, optional): Cache instance that determines if LibreOffice profile is to be copied and cached
                     Ignore for macros. Defaults to None.
+                reuse (bool, optional): If ``True`` and office is already loaded then the current connection is used
+                    and office is not closed when this loader exits; ``connector`` and ``cache_obj`` are ignored in this case.
+                    Defaults to ``False``.
             """
-            self.loader = Lo.load_office(connector=connector, cache_obj=cache_obj)
+            self._owns_office = True
+            if reuse and Lo._is_office_alive():
+                self.loader = Lo.qi(XComponentLoader, Lo._xdesktop, True)
+                self._owns_office = False
+            else:
+                self.loader = Lo.load_office(connector=connector, cache_obj=cache_obj)
 
         def __enter__(self) -> XComponentLoader:
             return self.loader
 
         def __exit__(self, exc_type, exc_val, exc_tb):
-            Lo.close_office()
+            # only the loader that started office closes it.
+            if self._owns_office:
+                Lo.close_office()
 
     # region docType ints
     class DocType(IntEnum):
@@ -246,6 +291,10 @@ class Lo(metaclass=StaticProperty):
     _ms_factory: XMultiServiceFactory = None
 
     _is_office_terminated: bool = False
+    _addon_desktop: Tuple[XComponentContext, XDesktop] | None = None
+    """(add-on context, desktop) pair used by addon_initialize()"""
+    _null_date: datetime | None = None
+    """cached value of null_date, set by prime_null_date()"""
 
     _lo_inst: ConnectBase = None
 
@@ -314,9 +363,12 @@ class Lo(metaclass=StaticProperty):
                 srch = Lo.qi(XSearchable, cell_range)
                 sd = srch.createSearchDescriptor()
         """
-        result = None
-        if uno.isInterface(atype) and hasattr(obj, "queryInterface"):
+        uno_t = _UNO_TYPE_CACHE.get(atype, None)
+        if uno_t is None and uno.isInterface(atype):
             uno_t = uno.getTypeByName(atype.__pyunointerface__)
+            _UNO_TYPE_CACHE[atype] = uno_t
+        result = None
+        if uno_t is not None and hasattr(obj, "queryInterface"):
             result = obj.queryInterface(uno_t)
         if raise_err is True and result is None:
             raise mEx.MissingInterfaceError(atype)
@@ -396,7 +448,7 @@ class Lo(metaclass=StaticProperty):
             else:
                 obj = msf.createInstance(service_name)
             if raise_err is True and obj is None:
-                mEx.CreateInstanceMsfError(atype, service_name)
+                raise mEx.CreateInstanceMsfError(atype, service_name)
             interface_obj = cls.qi(atype=atype, obj=obj)
             if raise_err is True and interface_obj is None:
                 raise mEx.MissingInterfaceError(atype)
@@ -459,10 +511,8 @@ class Lo(metaclass=StaticProperty):
             else:
                 obj = cls._mc_factory.createInstanceWithContext(service_name, cls._xcc)
             if raise_err is True and obj is None:
-                mEx.CreateInstanceMcfError(atype, service_name)
+                raise mEx.CreateInstanceMcfError(atype, service_name)
             interface_obj = cls.qi(atype=atype, obj=obj)
-            if raise_err is True and interface_obj is None:
-                raise mEx.MissingInterfaceError(atype)
             if interface_obj is None:
                 raise mEx.MissingInterfaceError(atype)
             return interface_obj
@@ -595,6 +645,7 @@ class Lo(metaclass=StaticProperty):
             Lo.print("Invalid Connector type. Fatal Error.")
             raise SystemExit(1)
 
+        cls._is_office_terminated = False
         cls._xcc = cls._lo_inst.ctx
         cls._mc_factory = cls._xcc.getServiceManager()
         if cls._mc_factory is None:
@@ -613,6 +664,11 @@ class Lo(metaclass=StaticProperty):
         return loader
         # return cls.xdesktop
 
+    @classmethod
+    def _is_office_alive(cls) -> bool:
+        # desktop is set to None when the bridge is disposed
+        return cls._xdesktop is not None and not cls._is_office_terminated
+
     # endregion Start Office
 
     # region office shutdown
@@ -652,6 +708,9 @@ class Lo(metaclass=StaticProperty):
         while cls._is_office_terminated is False and elapsed < seconds:
             elapsed = time.time() - start
             cls._is_office_terminated = cls._try_to_terminate(num_tries)
+            if cls._is_office_terminated:
+                break
+            # only wait before trying again
             time.sleep(0.5)
             num_tries += 1
         if cls._is_office_terminated:
@@ -841,9 +900,9 @@ class Lo(metaclass=StaticProperty):
             props = mProps.Props.make_props(Hidden=True)
         open_file_url = None
         if not mFileIO.FileIO.is_openable(pth):
-            if cls.is_url(pth):
-                Lo.print(f"Will treat filename as a URL: '{pth}'")
-                open_file_url = pth
+            if cls.is_url(fnm):
+                Lo.print(f"Will treat filename as a URL: '{fnm}'")
+                open_file_url = str(fnm)
             else:
                 raise Exception(f"Unable to get url from file: {pth}")
         else:
@@ -904,21 +963,11 @@ class Lo(metaclass=StaticProperty):
         if e == "":
             Lo.print("Empty string: Using writer")
             return cls.DocTypeStr.WRITER
-        if e == "odt":
-            return cls.DocTypeStr.WRITER
-        elif e == "odp":
-            return cls.DocTypeStr.IMPRESS
-        elif e == "odg":
-            return cls.DocTypeStr.DRAW
-        elif e == "ods":
-            return cls.DocTypeStr.CALC
-        elif e == "odb":
-            return cls.DocTypeStr.BASE
-        elif e == "odf":
-            return cls.DocTypeStr.MATH
-        else:
+        doc_type = _EXT_DOC_TYPE.get(e, None)
+        if doc_type is None:
             Lo.print(f"Do not recognize extension '{ext}'; using writer")
             return cls.DocTypeStr.WRITER
+        return doc_type
 
     @classmethod
     def doc_type_str(cls, doc_type_val: Lo.DocType) -> Lo.DocTypeStr:
@@ -931,21 +980,11 @@ class Lo(metaclass=StaticProperty):
         Returns:
             DocTypeStr: doc type as string.
         """
-        if doc_type_val == cls.DocType.WRITER:
-            return cls.DocTypeStr.WRITER
-        elif doc_type_val == cls.DocType.IMPRESS:
-            return cls.DocTypeStr.IMPRESS
-        elif doc_type_val == cls.DocType.DRAW:
-            return cls.DocTypeStr.DRAW
-        elif doc_type_val == cls.DocType.CALC:
-            return cls.DocTypeStr.CALC
-        elif doc_type_val == cls.DocType.BASE:
-            return cls.DocTypeStr.BASE
-        elif doc_type_val == cls.DocType.MATH:
-            return cls.DocTypeStr.MATH
-        else:
+        doc_type = _DOC_TYPE_STR.get(doc_type_val, None)
+        if doc_type is None:
             Lo.print(f"Do not recognize extension '{doc_type_val}'; using writer")
             return cls.DocTypeStr.WRITER
+        return doc_type
 
     @overload
     @classmethod
@@ -1408,99 +1447,13 @@ class Lo(metaclass=StaticProperty):
         """
         dtype = cls.DocType(doc_type)
         s = ext.lower()
-        if s == "doc":
-            return "MS Word 97"
-        elif s == "docx":
-            return "Office Open XML Text"  # MS Word 2007 XML
-        elif s == "rtf":
-            if dtype == cls.DocType.CALC:
-                return "Rich Text Format (StarCalc)"
-            else:
-                return "Rich Text Format"
-        elif s == "odt":
-            return "writer8"
-        elif s == "ott":
-            return "writer8_template"
-        elif s == "pdf":
-            if dtype == cls.DocType.WRITER:
-                return "writer_pdf_Export"
-            elif dtype == cls.DocType.IMPRESS:
-                return "impress_pdf_Export"
-            elif dtype == cls.DocType.DRAW:
-                return "draw_pdf_Export"
-            elif dtype == cls.DocType.CALC:
-                return "calc_pdf_Export"
-            elif dtype == cls.DocType.MATH:
-                return "math_pdf_Export"
-            else:
-                return "writer_pdf_Export"  # assume we are saving a writer doc
-        elif s == "txt":
-            return "Text"
-        elif s == "ppt":
-            return "MS PowerPoint 97"
-        elif s == "pptx":
-            return "Impress MS PowerPoint 2007 XML"
-        elif s == "odp":
-            return "impress8"
-        elif s == "odg":
-            return "draw8"
-        elif s == "jpg":
-            if dtype == cls.DocType.IMPRESS:
-                return "impress_jpg_Export"
-            else:
-                return "draw_jpg_Export"
-        elif s == "png":
-            if dtype == cls.DocType.IMPRESS:
-                return "impress_png_Export"
-            else:
-                return "draw_png_Export"
-        elif s == "xls":
-            return "MS Excel 97"
-        elif s == "xlsx":
-            return "Calc MS Excel 2007 XML"
-        elif s == "csv":
-            return "Text - txt - csv (StarCalc)"  # "Text CSV"
-        elif s == "ods":
-            return "calc8"
-        elif s == "odb":
-            return "StarOffice XML (Base)"
-        elif s == "htm" or s == "html":
-            if dtype == cls.DocType.WRITER:
-                return "HTML (StarWriter)"
-            elif dtype == cls.DocType.IMPRESS:
-                return "impress_html_Export"
-            elif dtype == cls.DocType.DRAW:
-                return "draw_html_Export"
-            elif dtype == cls.DocType.CALC:
-                return "HTML (StarCalc)"
-            else:
-                return "HTML"
-        elif s == "xhtml":
-            if dtype == cls.DocType.WRITER:
-                return "XHTML Writer File"
-            elif dtype == cls.DocType.IMPRESS:
-                return "XHTML Impress File"
-            elif dtype == cls.DocType.DRAW:
-                return "XHTML Draw File"
-            elif dtype == cls.DocType.CALC:
-                return "XHTML Calc File"
-            else:
-                return "XHTML Writer File"
-        elif s == "xml":
-            if dtype == cls.DocType.WRITER:
-                return "OpenDocument Text Flat XML"
-            elif dtype == cls.DocType.IMPRESS:
-                return "OpenDocument Presentation Flat XML"
-            elif dtype == cls.DocType.DRAW:
-                return "OpenDocument Drawing Flat XML"
-            elif dtype == cls.DocType.CALC:
-                return "OpenDocument Spreadsheet Flat XML"
-            else:
-                return "OpenDocument Text Flat XML"
-
-        else:
+        fmt = _EXT_FORMAT_BY_DOC_TYPE.get((s, dtype), None)
+        if fmt is None:
+            fmt = _EXT_FORMAT.get(s, None)
+        if fmt is None:
             Lo.print(f"Do not recognize extension '{ext}'; using text")
             return "Text"
+        return fmt
 
     # region    store_doc_format()
 
@@ -1771,15 +1724,21 @@ class Lo(metaclass=StaticProperty):
         if mc_factory is None:
             raise Exception("Office Service Manager is unavailable")
 
-        try:
-            xdesktop: XDesktop = mc_factory.createInstanceWithContext("com.sun.star.frame.Desktop", xcc)
-        except Exception:
-            raise Exception("Could not access desktop")
+        # desktop is a singleton for the context. Keep it so an add-on that re-enters does not create it again.
+        # Not cleared on reset as this method triggers reset itself.
+        if cls._addon_desktop is not None and cls._addon_desktop[0] == xcc:
+            xdesktop = cls._addon_desktop[1]
+        else:
+            try:
+                xdesktop: XDesktop = mc_factory.createInstanceWithContext("com.sun.star.frame.Desktop", xcc)
+            except Exception:
+                raise Exception("Could not access desktop")
+            cls._addon_desktop = (xcc, xdesktop)
         doc = xdesktop.getCurrentComponent()
         if doc is None:
             raise Exception("Could not access document")
         cls._ms_factory = cls.qi(XMultiServiceFactory, doc)
-        if cls._ms_factory in None:
+        if cls._ms_factory is None:
             raise mEx.MissingInterfaceError(XMultiServiceFactory)
         cls._doc = doc
         _Events().trigger(LoNamedEvent.DOC_OPENED, eargs)
@@ -1837,8 +1796,13 @@ class Lo(metaclass=StaticProperty):
         if doc is None:
             raise Exception("Could not access document")
         cls._ms_factory = cls.qi(XMultiServiceFactory, doc)
-        if cls._ms_factory in None:
+        if cls._ms_factory is None:
             raise mEx.MissingInterfaceError(XMultiServiceFactory)
+        # keep context and service manager so create_instance_mcf() creates services
+        # with the script's context directly.
+        cls._xcc = xcc
+        cls._mc_factory = mc_factory
+        cls._xdesktop = xdesktop
         cls._doc = doc
         _Events().trigger(LoNamedEvent.DOC_OPENED, eargs)
         return doc
@@ -1926,7 +1890,7 @@ class Lo(metaclass=StaticProperty):
         if frame is None:
             frame = cls._xdesktop.getCurrentFrame()
 
-        helper = cls.create_instance_mcf(XDispatchHelper, "com.sun.star.frame.DispatchHelper")
+        helper = cls._get_dispatch_helper()
         if helper is None:
             raise mEx.MissingInterfaceError(XDispatchHelper, f"Could not create dispatch helper for command {cmd}")
         try:
@@ -1936,6 +1900,90 @@ class Lo(metaclass=StaticProperty):
         except Exception as e:
             raise Exception(f"Could not dispatch '{cmd}'") from e
 
+    @classmethod
+    def dispatch_cmds(
+        cls, cmds: Iterable[Tuple[str, Iterable[PropertyValue] | None]], frame: XFrame = None
+    ) -> List[bool]:
+        """
+        Dispatches a batch of LibreOffice commands.
+
+        The frame and dispatch helper are resolved once for the whole batch.
+        A command that fails to dispatch does not stop the remaining commands from being dispatched.
+
+        Args:
+            cmds (Iterable[Tuple[str, Iterable[PropertyValue] | None]]): Pairs of command and properties such as ``("GoToCell", props)``.
+                Note: command does not contain ``.uno:`` prefix. Properties may be ``None``.
+            frame (XFrame, optional): Frame to dispatch to. Defaults to current frame.
+
+        Raises:
+            MissingInterfaceError: If unable to obtain XDispatchHelper instance.
+
+        Returns:
+            List[bool]: One result per command. ``True`` if command was dispatched;
+            otherwise, ``False`` if command was canceled or failed.
+
+         :events:
+            .. cssclass:: lo_event
+
+                - :py:attr:`~.events.lo_named_event.LoNamedEvent.DISPATCHING` :eventref:`src-docs-event-cancel`
+                - :py:attr:`~.events.lo_named_event.LoNamedEvent.DISPATCHED` :eventref:`src-docs-event`
+
+        Note:
+            Events are triggered for each command in the batch.
+
+        See Also:
+            :py:meth:`~.Lo.dispatch_cmd`
+        """
+        if frame is None:
+            frame = cls._xdesktop.getCurrentFrame()
+
+        helper = cls._get_dispatch_helper()
+        if helper is None:
+            raise mEx.MissingInterfaceError(XDispatchHelper, "Could not create dispatch helper for commands")
+
+        events = _Events()
+        results = []
+        for cmd, props in cmds:
+            cargs = DispatchCancelArgs(Lo.dispatch_cmds.__qualname__, cmd)
+            events.trigger(LoNamedEvent.DISPATCHING, cargs)
+            if cargs.cancel:
+                results.append(False)
+                continue
+            try:
+                helper.executeDispatch(frame, f".uno:{cmd}", "", 0, props or ())
+            except Exception as e:
+                Lo.print(f"Could not dispatch '{cmd}'")
+                Lo.print(f"    {e}")
+                results.append(False)
+                continue
+            events.trigger(LoNamedEvent.DISPATCHED, DispatchArgs.from_args(cargs))
+            results.append(True)
+        return results
+
+    @classmethod
+    def _get_dispatch_helper(cls) -> XDispatchHelper | None:
+        # DispatchHelper is stateless. Created once and cleared on office reset.
+        try:
+            return cls._dispatch_helper
+        except AttributeError:
+            helper = cls.create_instance_mcf(XDispatchHelper, "com.sun.star.frame.DispatchHelper")
+            if helper is None:
+                return None
+            cls._dispatch_helper = helper
+        return cls._dispatch_helper
+
+    @classmethod
+    def _get_introspection(cls) -> XIntrospection | None:
+        # Introspection is stateless. Created once and cleared on office reset.
+        try:
+            return cls._introspection
+        except AttributeError:
+            intro = cls.create_instance_mcf(XIntrospection, "com.sun.star.beans.Introspection")
+            if intro is None:
+                return None
+            cls._introspection = intro
+        return cls._introspection
+
     # ================= Uno cmds =========================
 
     @staticmethod
@@ -1965,16 +2013,12 @@ class Lo(metaclass=StaticProperty):
         Returns:
             str: uno command
         """
-        try:
-            foo_pos = uno_cmd.index("Foo.")
-        except ValueError:
-            raise ValueError(f"Could not find Foo header in command: '{uno_cmd}'")
-        try:
-            lang_pos = uno_cmd.index("?language")
-        except ValueError:
+        m = _UNO_ITEM_RE.search(uno_cmd)
+        if m is None:
+            if "Foo." not in uno_cmd:
+                raise ValueError(f"Could not find Foo header in command: '{uno_cmd}'")
             raise ValueError(f"Could not find language header in command: '{uno_cmd}'")
-        start = foo_pos + 4
-        return uno_cmd[start:lang_pos]
+        return m.group(1)
 
     # ======================== use Inspector extensions ====================
 
@@ -2000,7 +2044,12 @@ class Lo(metaclass=StaticProperty):
                 Lo.print("Inspector Service could not be instantiated")
                 return
             Lo.print("Inspector Service instantiated")
-            intro = cls.create_instance_mcf(XIntrospection, "com.sun.star.beans.Introspection")
+            if hasattr(inspector, "inspect"):
+                # pyuno resolves the method by name on the proxy.
+                inspector.inspect(obj, title)
+                return
+            # fall back to introspection when the proxy does not expose inspect()
+            intro = cls._get_introspection()
             intro_acc = intro.inspect(inspector)
             method = intro_acc.getMethod("inspect", -1)
             Lo.print(f"inspect() method was found: {method is not None}")
@@ -2055,6 +2104,30 @@ class Lo(metaclass=StaticProperty):
 
     wait = delay
 
+    @staticmethod
+    def delay_until(deadline_ns: int) -> None:
+        """
+        Delay execution until a given point in time.
+
+        Useful when scheduling a sequence of delays as waits do not accumulate drift.
+
+        Args:
+            deadline_ns (int): Deadline in nanoseconds as returned by ``time.monotonic_ns()``.
+                If deadline has already passed then there is no delay.
+
+        Example:
+            .. code-block:: python
+
+                deadline = time.monotonic_ns()
+                for cmd in cmds:
+                    Lo.dispatch_cmd(cmd)
+                    deadline += 500_000_000  # 500 ms
+                    Lo.delay_until(deadline)
+        """
+        remaining = deadline_ns - time.monotonic_ns()
+        if remaining > 0:
+            time.sleep(remaining / 1_000_000_000)
+
     @staticmethod
     def is_none_or_empty(s: str) -> bool:
         """
@@ -2066,7 +2139,7 @@ class Lo(metaclass=StaticProperty):
         Returns:
             bool: True if None or empty string; Otherwise, False
         """
-        return s == None or len(s) == 0
+        return not s
 
     is_null_or_empty = is_none_or_empty
 
@@ -2089,12 +2162,11 @@ class Lo(metaclass=StaticProperty):
             bool: True if URL format; Otherwise, False
         """
         # https://stackoverflow.com/questions/7160737/how-to-validate-a-url-in-python-malformed-or-not
-        try:
-            pth = mFileIO.FileIO.get_absolute_path(fnm)
-            result = urlparse(str(pth))
-            return all([result.scheme, result.netloc])
-        except ValueError:
-            return False
+        # scheme followed by a non empty network location. Checked on the string as given;
+        # resolving it as a path first would collapse the '//' and never match.
+        s = str(fnm)
+        # substring test rejects plain file paths before running the regex.
+        return "://" in s and _URL_RE.match(s) is not None
 
     # endregion document opening
 
@@ -2112,23 +2184,23 @@ class Lo(metaclass=StaticProperty):
         return s.capitalize()
 
     @staticmethod
-    def parse_int(s: str) -> int:
+    def parse_int(s: str, default: int = 0) -> int:
         """
         Converts string into int.
 
         Args:
             s (str): string to parse
+            default (int, optional): Value returned when ``s`` can not be converted. Defaults to ``0``.
 
         Returns:
-            int: String as int. If unable to convert s to int then 0 is returned.
+            int: String as int. If unable to convert s to int then ``default`` is returned.
         """
-        if s is None:
-            return 0
+        if not s:
+            return default
         try:
             return int(s)
-        except ValueError:
-            Lo.print(f"{s} could not be parsed as an int; using 0")
-        return 0
+        except (ValueError, TypeError):
+            return default
 
     @overload
     @staticmethod
@@ -2160,7 +2232,7 @@ class Lo(metaclass=StaticProperty):
 
         Args:
             names (Iterable[str]): names to print
-            num_per_line (int): Number of names per line.
+            num_per_line (int): Number of names per line. Default one name per line.
         """
         cargs = CancelEventArgs(Lo.print_names.__qualname__)
         _Events().trigger(GblNamedEvent.PRINTING, cargs)
@@ -2170,15 +2242,12 @@ class Lo(metaclass=StaticProperty):
             print("  No names found")
             return
         sorted_list = sorted(names, key=str.casefold)
-        print(f"No. of names: {len(sorted_list)}")
-        nl_count = 0
-        for name in sorted_list:
-            print(f"  '{name}'")
-            nl_count += 1
-        if nl_count % num_per_line == 0:
-            print()
-            nl_count = 0
-        print("\n\n")
+        per_line = max(num_per_line, 1)
+        quoted = [f"  '{name}'" for name in sorted_list]
+        lines = [f"No. of names: {len(sorted_list)}"]
+        lines.extend("".join(quoted[i : i + per_line]) for i in range(0, len(quoted), per_line))
+        # single write for the whole block
+        print("\n".join(lines), end="\n\n\n\n")
 
     # ------------------- container manipulation --------------------
 
@@ -2195,11 +2264,10 @@ class Lo(metaclass=StaticProperty):
         _Events().trigger(GblNamedEvent.PRINTING, cargs)
         if cargs.cancel:
             return
-        print(f"-- {name} ----------------")
-        for row in table:
-            col_str = "  ".join([str(el) for el in row])
-            print(col_str)
-        print()
+        lines = [f"-- {name} ----------------"]
+        lines.extend("  ".join(map(str, row)) for row in table)
+        # single write for the whole table
+        print("\n".join(lines), end="\n\n")
 
     @staticmethod
     def get_container_names(con: XIndexAccess) -> List[str] | None:
@@ -2215,15 +2283,17 @@ class Lo(metaclass=StaticProperty):
         if con is None:
             Lo.print("Container is null")
             return None
-        num_el = con.getCount()
-        if num_el == 0:
-            Lo.print("No elements in the container")
-            return None
+        name_acc = Lo.qi(XNameAccess, con)
+        if name_acc is not None:
+            # one bridge call for all names
+            names_list = list(name_acc.getElementNames())
+        else:
+            num_el = con.getCount()
+            if num_el == 0:
+                Lo.print("No elements in the container")
+                return None
 
-        names_list = []
-        for i in range(num_el):
-            named = con.getByIndex(i)
-            names_list.append(named.getName())
+            names_list = [con.getByIndex(i).getName() for i in range(num_el)]
 
         if len(names_list) == 0:
             Lo.print("No element names found in the container")
@@ -2247,6 +2317,12 @@ class Lo(metaclass=StaticProperty):
         """
         if con is None:
             raise TypeError("Container is null")
+        name_acc = cls.qi(XNameAccess, con)
+        if name_acc is not None:
+            if name_acc.hasByName(nm):
+                return cls.qi(XPropertySet, name_acc.getByName(nm))
+            cls.print(f"Could not find a '{nm}' property set in the container")
+            return None
         for i in range(con.getCount()):
             try:
                 el = con.getByIndex(i)
@@ -2432,22 +2508,43 @@ class Lo(metaclass=StaticProperty):
         Note:
             If Lo has no document to determine date from then a
             default date of 1889/12/30 is returned.
+
+            Value is cached for the current document. After a document is opened or created
+            it is read again on first access, see :py:meth:`~.Lo.prime_null_date`.
+        """
+        if cls._null_date is not None:
+            return cls._null_date
+        return cls.prime_null_date()
+
+    @classmethod
+    def prime_null_date(cls) -> datetime:
+        """
+        Reads Null Date from current document and caches it for :py:attr:`~.Lo.null_date`
+
+        Returns:
+            datetime: Null Date in UTC.
+
+        Note:
+            Called by :py:attr:`~.Lo.null_date` on first access after a document is opened or created.
+            Call it directly to read the value before it is needed.
+
+            If Lo has no document to determine date from then a
+            default date of 1889/12/30 is returned and nothing is cached.
         """
         # https://tinyurl.com/2pdrt5z9#NullDate
-        try:
-            return cls.__null_date
-        except AttributeError:
-            cls.__null_date = datetime(year=1889, month=12, day=30, tzinfo=timezone.utc)
-            if cls._doc is None:
-                return cls.__null_date
-            n_supplier = cls.qi(XNumberFormatsSupplier, cls._doc)
-            if n_supplier is None:
-                # this is not always a XNumberFormatsSupplier such as *.odp documents
-                return cls.__null_date
-            number_settings = n_supplier.getNumberFormatSettings()
-            d = number_settings.getPropertyValue("NullDate")
-            cls.__null_date = datetime(d.Year, d.Month, d.Day, tzinfo=timezone.utc)
-        return cls.__null_date
+        default = datetime(year=1889, month=12, day=30, tzinfo=timezone.utc)
+        if cls._doc is None:
+            return default
+        n_supplier = cls.qi(XNumberFormatsSupplier, cls._doc)
+        if n_supplier is None:
+            # this is not always a XNumberFormatsSupplier such as *.odp documents
+            cls._null_date = default
+            return default
+        number_settings = n_supplier.getNumberFormatSettings()
+        d = number_settings.getPropertyValue("NullDate")
+        null_date = datetime(d.Year, d.Month, d.Day, tzinfo=timezone.utc)
+        cls._null_date = null_date
+        return null_date
 
     @null_date.setter
     def null_date(cls, value) -> None:
@@ -2581,16 +2678,97 @@ class Lo(metaclass=StaticProperty):
             return cls._bridge_component
 
 
+_EXT_DOC_TYPE = {
+    "odt": Lo.DocTypeStr.WRITER,
+    "odp": Lo.DocTypeStr.IMPRESS,
+    "odg": Lo.DocTypeStr.DRAW,
+    "ods": Lo.DocTypeStr.CALC,
+    "odb": Lo.DocTypeStr.BASE,
+    "odf": Lo.DocTypeStr.MATH,
+}
+"""Extension to doc type table for Lo.ext_to_doc_type()"""
+
+_DOC_TYPE_STR = {
+    Lo.DocType.WRITER: Lo.DocTypeStr.WRITER,
+    Lo.DocType.IMPRESS: Lo.DocTypeStr.IMPRESS,
+    Lo.DocType.DRAW: Lo.DocTypeStr.DRAW,
+    Lo.DocType.CALC: Lo.DocTypeStr.CALC,
+    Lo.DocType.BASE: Lo.DocTypeStr.BASE,
+    Lo.DocType.MATH: Lo.DocTypeStr.MATH,
+}
+"""Doc type to doc type string table for Lo.doc_type_str()"""
+
+_EXT_FORMAT = {
+    "doc": "MS Word 97",
+    "docx": "Office Open XML Text",  # MS Word 2007 XML
+    "rtf": "Rich Text Format",
+    "odt": "writer8",
+    "ott": "writer8_template",
+    "pdf": "writer_pdf_Export",  # assume we are saving a writer doc
+    "txt": "Text",
+    "ppt": "MS PowerPoint 97",
+    "pptx": "Impress MS PowerPoint 2007 XML",
+    "odp": "impress8",
+    "odg": "draw8",
+    "jpg": "draw_jpg_Export",
+    "png": "draw_png_Export",
+    "xls": "MS Excel 97",
+    "xlsx": "Calc MS Excel 2007 XML",
+    "csv": "Text - txt - csv (StarCalc)",  # "Text CSV"
+    "ods": "calc8",
+    "odb": "StarOffice XML (Base)",
+    "htm": "HTML",
+    "html": "HTML",
+    "xhtml": "XHTML Writer File",
+    "xml": "OpenDocument Text Flat XML",
+}
+"""Extension to format table for Lo.ext_to_format(), used when format does not depend on doc type"""
+
+_EXT_FORMAT_BY_DOC_TYPE = {
+    ("rtf", Lo.DocType.CALC): "Rich Text Format (StarCalc)",
+    ("pdf", Lo.DocType.WRITER): "writer_pdf_Export",
+    ("pdf", Lo.DocType.IMPRESS): "impress_pdf_Export",
+    ("pdf", Lo.DocType.DRAW): "draw_pdf_Export",
+    ("pdf", Lo.DocType.CALC): "calc_pdf_Export",
+    ("pdf", Lo.DocType.MATH): "math_pdf_Export",
+    ("jpg", Lo.DocType.IMPRESS): "impress_jpg_Export",
+    ("png", Lo.DocType.IMPRESS): "impress_png_Export",
+    ("htm", Lo.DocType.WRITER): "HTML (StarWriter)",
+    ("htm", Lo.DocType.IMPRESS): "impress_html_Export",
+    ("htm", Lo.DocType.DRAW): "draw_html_Export",
+    ("htm", Lo.DocType.CALC): "HTML (StarCalc)",
+    ("html", Lo.DocType.WRITER): "HTML (StarWriter)",
+    ("html", Lo.DocType.IMPRESS): "impress_html_Export",
+    ("html", Lo.DocType.DRAW): "draw_html_Export",
+    ("html", Lo.DocType.CALC): "HTML (StarCalc)",
+    ("xhtml", Lo.DocType.IMPRESS): "XHTML Impress File",
+    ("xhtml", Lo.DocType.DRAW): "XHTML Draw File",
+    ("xhtml", Lo.DocType.CALC): "XHTML Calc File",
+    ("xml", Lo.DocType.IMPRESS): "OpenDocument Presentation Flat XML",
+    ("xml", Lo.DocType.DRAW): "OpenDocument Drawing Flat XML",
+    ("xml", Lo.DocType.CALC): "OpenDocument Spreadsheet Flat XML",
+}
+"""(extension, doc type) to format table for Lo.ext_to_format(), checked before ``_EXT_FORMAT``"""
+
+
 class _LoManager(metaclass=StaticProperty):
     """Manages clearing and resetting for Lo static class"""
 
     @staticmethod
     def del_cache_attrs(source: object, event: EventArgs) -> None:
         # clears Lo Attributes that are dynamically created
-        dattrs = ("_xscript_context", "_is_macro_mode", "_this_component", "_bridge_component", "__null_date")
+        dattrs = (
+            "_xscript_context",
+            "_is_macro_mode",
+            "_this_component",
+            "_bridge_component",
+            "_dispatch_helper",
+            "_introspection",
+        )
         for attr in dattrs:
             if hasattr(Lo, attr):
                 delattr(Lo, attr)
+        Lo._null_date = None
 
     @staticmethod
     def disposing_bridge(src: XEventAdapter, event: EventObject) -> None:
@@ -2621,6 +2799,11 @@ class _LoManager(metaclass=StaticProperty):
         if Lo.bridge is not None:
             Lo.bridge.addEventListener(_LoManager.event_adapter)
 
+    @staticmethod
+    def on_doc_loaded(source: Any, event: EventArgs) -> None:
+        # cached null date belongs to the previous document. Lo.null_date reads it again on next access.
+        Lo._null_date = None
+
     @classproperty
     def event_adapter(cls) -> XEventAdapter:
         try:
@@ -2636,6 +2819,8 @@ _Events().on(LoNamedEvent.RESET, _LoManager.del_cache_attrs)
 _Events().on(LoNamedEvent.OFFICE_LOADING, _LoManager.on_loading)
 _Events().on(LoNamedEvent.OFFICE_LOADED, _LoManager.on_loaded)
 _Events().on(LoNamedEvent.BRIDGE_DISPOSED, _LoManager.on_disposed)
+_Events().on(LoNamedEvent.DOC_OPENED, _LoManager.on_doc_loaded)
+_Events().on(LoNamedEvent.DOC_CREATED, _LoManager.on_doc_loaded)
 
 
 __all__ = ("Lo",)
@@ -112,10 +112,8 @@ class Props:
                     }
                 props = Props.make_props(**p_dic)
         """
-        lst = []
-        for k, v in kwargs.items():
-            lst.append(cls.make_prop_value(name=k, value=v))
-        return tuple(lst)
+        make = cls.make_prop_value
+        return tuple([make(name=k, value=v) for k, v in kwargs.items()])
 
     # endregion ---------------- make properties -----------------------
 
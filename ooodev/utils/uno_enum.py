@@ -127,12 +127,13 @@ else:
             #     # such as when a class instance is assigned to a constant
             #     # see Write class
             #     return type_name
-            if type_name in cls._loaded:
-                return cls._loaded[type_name]
+            e = cls._loaded.get(type_name, None)
+            if e is not None:
+                return e
             e = super().__new__(cls)
             e.__dict__["_type_name"] = type_name
-            cls._loaded[type_name] = e
-            return e
+            # setdefault keeps the first instance if another thread got here first.
+            return cls._loaded.setdefault(type_name, e)
             
         def __init__(self, type_name: str) -> None:
             """
@@ -148,13 +149,14 @@ else:
         def __getattr__(self, __name: str) -> uno.Enum | Any:
             if self._initialized:
                 # Provide the caller attributes in whatever ways interest you.
+                # Only called on a miss. Once stored in __dict__ later access
+                # is a normal attribute lookup that does not reach __getattr__.
                 try:
-                    key = __name
                     e = uno.Enum(self._type_name, __name)
-                    self.__dict__[key] = e
-                    return self.__dict__[key]
                 except Exception:
                     raise AttributeError(f"Enum {self._type_name} has no attribute {__name}")
+                self.__dict__[__name] = e
+                return e
             else:
                 try:
                     return self.__dict__[__name] # Transparent access to instance vars.
@@ -64,4 +64,26 @@ def test_from_args(event_name_str:str, value: int):
     assert e.event_data == eargs.event_data
     assert e.source is eargs.source
     assert e.event_name == eargs.event_name
-    
\ No newline at end of file
+    
+
+def test_no_instance_dict():
+    from ooodev.events.args.event_args import EventArgs
+    from ooodev.events.args.cancel_event_args import CancelEventArgs
+    from ooodev.events.args.dispatch_args import DispatchArgs
+    from ooodev.events.args.dispatch_cancel_args import DispatchCancelArgs
+    from ooodev.events.args.calc.cell_args import CellArgs
+    from ooodev.events.args.calc.cell_cancel_args import CellCancelArgs
+    from ooodev.events.args.calc.sheet_args import SheetArgs
+    from ooodev.events.args.calc.sheet_cancel_args import SheetCancelArgs
+
+    for e in (
+        EventArgs(test_no_instance_dict),
+        CancelEventArgs(test_no_instance_dict),
+        DispatchArgs(test_no_instance_dict, ".uno:Copy"),
+        DispatchCancelArgs(test_no_instance_dict, ".uno:Copy"),
+        CellArgs(test_no_instance_dict),
+        CellCancelArgs(test_no_instance_dict),
+        SheetArgs(test_no_instance_dict),
+        SheetCancelArgs(test_no_instance_dict),
+    ):
+        assert not hasattr(e, "__dict__")
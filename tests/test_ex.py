@@ -0,0 +1,88 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.exceptions import ex as mEx
+
+
+def test_property_error_str():
+    e = mEx.PropertyError("CharWeight")
+    assert str(e) == repr("Property Error for: CharWeight")
+
+
+def test_property_not_found_error_str():
+    e = mEx.PropertyNotFoundError("CharWeight")
+    assert str(e) == repr("Property not found for: CharWeight")
+
+
+def test_un_openable_error_str():
+    e = mEx.UnOpenableError("/tmp/none.odt")
+    assert str(e) == repr("Un-openable file: '/tmp/none.odt'")
+
+
+def test_not_supported_service_error_str():
+    e = mEx.NotSupportedServiceError("com.sun.star.style.ParagraphStyle")
+    assert str(e) == repr("Service not supported: 'com.sun.star.style.ParagraphStyle'")
+
+
+def test_multi_error():
+    errs = [mEx.PropertyError("CharWeight"), mEx.PropertyError("CharColor")]
+    e = mEx.MultiError(errs)
+    assert isinstance(e.errors, tuple)
+    assert str(e) == f"{errs[0]}\n{errs[1]}"
+
+
+def test_missing_interface_error():
+    class XFoo:
+        __pyunointerface__ = "com.sun.star.foo.XFoo"
+
+    e = mEx.MissingInterfaceError(XFoo)
+    assert e.interface is XFoo
+    assert str(e) == repr("Missing interface com.sun.star.foo.XFoo")
+    e = mEx.MissingInterfaceError(XFoo, "Could not access foo")
+    assert e.args[0] == "Could not access foo"
+    assert str(e) == repr("Could not access foo")
+
+
+def test_create_instance_error():
+    e = mEx.CreateInstanceMsfError(None, "com.sun.star.text.TextFrame")
+    assert e.interface is None
+    assert e.service == "com.sun.star.text.TextFrame"
+    assert str(e).startswith("Unable to create instance for service 'com.sun.star.text.TextFrame'")
+
+
+@pytest.mark.parametrize("err", [mEx.CreateInstanceMsfError, mEx.CreateInstanceMcfError, mEx.CreateInstanceError])
+def test_create_instance_error_pickle(err):
+    import copy
+    import pickle
+
+    e = err(None, "com.sun.star.text.TextFrame", "Could not create frame", 12)
+    for e2 in (pickle.loads(pickle.dumps(e)), copy.copy(e)):
+        assert type(e2) is err
+        assert e2.interface is None
+        assert e2.service == e.service
+        assert e2.args == e.args
+        assert str(e2) == str(e)
+
+    e = err(None, "com.sun.star.text.TextFrame")
+    e2 = pickle.loads(pickle.dumps(e))
+    assert e2.service == e.service
+    assert str(e2) == str(e)
+
+
+def test_missing_interface_error_pickle():
+    import copy
+    import pickle
+
+    e = mEx.MissingInterfaceError(None, "Could not access foo", 12)
+    for e2 in (pickle.loads(pickle.dumps(e)), copy.copy(e)):
+        assert type(e2) is mEx.MissingInterfaceError
+        assert e2.interface is None
+        assert e2.args == e.args
+        assert str(e2) == repr("Could not access foo")
+
+    e = mEx.MissingInterfaceError(None)
+    e2 = pickle.loads(pickle.dumps(e))
+    assert str(e2) == str(e)
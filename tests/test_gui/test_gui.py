@@ -87,4 +87,37 @@ def test_activate_new_doc(loader) -> None:
 
     finally:
         Lo.close_doc(doc, False)
-        # pass
\ No newline at end of file
+        # pass
+
+
+def test_hide_except() -> None:
+    from ooodev.utils.gui import GUI
+
+    class Elem:
+        def __init__(self, url: str) -> None:
+            self.ResourceURL = url
+
+    class LayoutManager:
+        def __init__(self) -> None:
+            self.hidden = []
+
+        def hideElement(self, name: str) -> bool:
+            self.hidden.append(name)
+            return True
+
+    missing = "private:resource/toolbar/missing"
+    show_elms = [GUI.STANDARD_BAR, missing, GUI.FIND_BAR, missing]
+    show_elms_copy = list(show_elms)
+    ui_elms = [Elem(GUI.MENU_BAR), Elem(GUI.STANDARD_BAR), Elem(GUI.STATUS_BAR), Elem(GUI.FIND_BAR)]
+    lm = LayoutManager()
+
+    result = GUI.hide_except(lm, ui_elms, show_elms)
+    assert result == [missing]
+    assert show_elms == show_elms_copy
+    assert lm.hidden == [GUI.MENU_BAR, GUI.STATUS_BAR]
+
+    # a tuple is accepted and all names found leaves nothing remaining
+    lm = LayoutManager()
+    result = GUI.hide_except(lm, ui_elms, (GUI.MENU_BAR, GUI.STATUS_BAR))
+    assert result == []
+    assert lm.hidden == [GUI.STANDARD_BAR, GUI.FIND_BAR]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import pytest
+from typing import Any
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -33,4 +34,306 @@ def _test_dispose() -> None:
     # bridge via LoNamedEvent.OFFICE_LOADED event.
     assert Lo._xcc is None
     assert Lo._mc_factory is None
-    assert Lo._lo_inst is None
\ No newline at end of file
+    assert Lo._lo_inst is None
+
+
+# expected ext_to_format() results. (default format, {doc type value: format})
+# doc type values: UNKNOWN = 0, WRITER = 1, BASE = 2, CALC = 3, DRAW = 4, IMPRESS = 5, MATH = 6
+_EXT_FORMAT_EXPECTED = {
+    "doc": ("MS Word 97", {}),
+    "docx": ("Office Open XML Text", {}),
+    "rtf": ("Rich Text Format", {3: "Rich Text Format (StarCalc)"}),
+    "odt": ("writer8", {}),
+    "ott": ("writer8_template", {}),
+    "pdf": (
+        "writer_pdf_Export",
+        {1: "writer_pdf_Export", 5: "impress_pdf_Export", 4: "draw_pdf_Export", 3: "calc_pdf_Export", 6: "math_pdf_Export"},
+    ),
+    "txt": ("Text", {}),
+    "ppt": ("MS PowerPoint 97", {}),
+    "pptx": ("Impress MS PowerPoint 2007 XML", {}),
+    "odp": ("impress8", {}),
+    "odg": ("draw8", {}),
+    "jpg": ("draw_jpg_Export", {5: "impress_jpg_Export"}),
+    "png": ("draw_png_Export", {5: "impress_png_Export"}),
+    "xls": ("MS Excel 97", {}),
+    "xlsx": ("Calc MS Excel 2007 XML", {}),
+    "csv": ("Text - txt - csv (StarCalc)", {}),
+    "ods": ("calc8", {}),
+    "odb": ("StarOffice XML (Base)", {}),
+    "htm": ("HTML", {1: "HTML (StarWriter)", 5: "impress_html_Export", 4: "draw_html_Export", 3: "HTML (StarCalc)"}),
+    "html": ("HTML", {1: "HTML (StarWriter)", 5: "impress_html_Export", 4: "draw_html_Export", 3: "HTML (StarCalc)"}),
+    "xhtml": (
+        "XHTML Writer File",
+        {1: "XHTML Writer File", 5: "XHTML Impress File", 4: "XHTML Draw File", 3: "XHTML Calc File"},
+    ),
+    "xml": (
+        "OpenDocument Text Flat XML",
+        {
+            1: "OpenDocument Text Flat XML",
+            5: "OpenDocument Presentation Flat XML",
+            4: "OpenDocument Drawing Flat XML",
+            3: "OpenDocument Spreadsheet Flat XML",
+        },
+    ),
+    # unknown extensions default to Text
+    "abc": ("Text", {}),
+    "": ("Text", {}),
+    ".odt": ("Text", {}),
+}
+
+
+@pytest.mark.parametrize("doc_type_val", range(7))
+@pytest.mark.parametrize("ext", list(_EXT_FORMAT_EXPECTED.keys()))
+def test_ext_to_format(ext: str, doc_type_val: int) -> None:
+    from ooodev.utils.lo import Lo
+
+    default, by_type = _EXT_FORMAT_EXPECTED[ext]
+    expected = by_type.get(doc_type_val, default)
+    doc_type = Lo.DocType(doc_type_val)
+    assert Lo.ext_to_format(ext, doc_type) == expected
+    # lookup is not case sensitive
+    assert Lo.ext_to_format(ext.upper(), doc_type) == expected
+    if doc_type == Lo.DocType.UNKNOWN:
+        assert Lo.ext_to_format(ext) == expected
+
+
+@pytest.mark.parametrize(
+    "ext, expected",
+    [
+        ("odt", "swriter"),
+        ("odp", "simpress"),
+        ("odg", "sdraw"),
+        ("ods", "scalc"),
+        ("odb", "sbase"),
+        ("odf", "smath"),
+        (".ods", "scalc"),
+        ("ODS", "scalc"),
+        ("", "swriter"),
+        ("doc", "swriter"),
+        ("abc", "swriter"),
+    ],
+)
+def test_ext_to_doc_type(ext: str, expected: str) -> None:
+    from ooodev.utils.lo import Lo
+
+    assert Lo.ext_to_doc_type(ext) == expected
+
+
+@pytest.mark.parametrize("doc_type_val", range(7))
+def test_doc_type_str(doc_type_val: int) -> None:
+    from ooodev.utils.lo import Lo
+
+    expected = {
+        1: Lo.DocTypeStr.WRITER,
+        2: Lo.DocTypeStr.BASE,
+        3: Lo.DocTypeStr.CALC,
+        4: Lo.DocTypeStr.DRAW,
+        5: Lo.DocTypeStr.IMPRESS,
+        6: Lo.DocTypeStr.MATH,
+    }.get(doc_type_val, Lo.DocTypeStr.WRITER)
+    assert Lo.doc_type_str(Lo.DocType(doc_type_val)) == expected
+
+
+def test_loader_reuse(loader) -> None:
+    from ooodev.utils.lo import Lo
+    from ooodev.events.lo_events import Events
+    from ooodev.events.lo_named_event import LoNamedEvent
+
+    closing = False
+
+    def on_closing(source: Any, args: Any) -> None:
+        nonlocal closing
+        closing = True
+
+    events = Events()
+    events.on(LoNamedEvent.OFFICE_CLOSING, on_closing)
+
+    assert Lo._is_office_alive()
+    desktop = Lo._xdesktop
+    with Lo.Loader(Lo.ConnectPipe(headless=True), reuse=True) as inner_loader:
+        assert inner_loader is not None
+        assert Lo._xdesktop is desktop
+    # the reusing loader does not own office so office is left running.
+    assert closing is False
+    assert Lo._is_office_alive()
+    assert Lo._xdesktop is desktop
+
+
+def test_is_office_alive(loader, monkeypatch) -> None:
+    from ooodev.utils.lo import Lo
+
+    assert Lo._is_office_alive()
+    monkeypatch.setattr(Lo, "_is_office_terminated", True)
+    assert Lo._is_office_alive() is False
+    monkeypatch.setattr(Lo, "_is_office_terminated", False)
+    monkeypatch.setattr(Lo, "_xdesktop", None)
+    assert Lo._is_office_alive() is False
+
+
+def test_default_props_not_shared(loader) -> None:
+    # a listener that modifies props in event data must not affect later calls
+    from ooodev.utils.lo import Lo
+    from ooodev.events.lo_events import LoEvents
+    from ooodev.events.lo_named_event import LoNamedEvent
+    from ooodev.events.args.cancel_event_args import CancelEventArgs
+    from ooodev.exceptions import ex as mEx
+
+    seen = []
+
+    def on_event(source, event: CancelEventArgs) -> None:
+        props = event.event_data["props"]
+        seen.append({p.Name: p.Value for p in props})
+        for p in props:
+            p.Name = "Changed"
+            p.Value = None
+        event.cancel = True
+
+    events = LoEvents()
+    events.on(LoNamedEvent.DOC_OPENING, on_event)
+    events.on(LoNamedEvent.DOC_CREATING, on_event)
+    try:
+        for _ in range(2):
+            with pytest.raises(mEx.CancelEventError):
+                Lo.open_readonly_doc("not_opened.odt", loader)
+        for _ in range(2):
+            with pytest.raises(mEx.CancelEventError):
+                Lo.create_macro_doc(Lo.DocTypeStr.WRITER, loader)
+    finally:
+        events.remove(LoNamedEvent.DOC_OPENING, on_event)
+        events.remove(LoNamedEvent.DOC_CREATING, on_event)
+
+    assert len(seen) == 4
+    assert seen[0] == {"Hidden": True, "ReadOnly": True}
+    assert seen[1] == seen[0]
+    assert seen[2]["Hidden"] is False
+    assert seen[3] == seen[2]
+
+
+@pytest.mark.parametrize(
+    "fnm, expected",
+    [
+        ("http://www.example.org", True),
+        ("https://www.example.org/doc.odt?x=1", True),
+        ("ftp://ftp.example.org/pub/doc.odt", True),
+        ("file:///home/user/doc.odt", False),
+        ("http://", False),
+        ("/home/user/doc.odt", False),
+        ("doc.odt", False),
+        ("C:\\Users\\user\\doc.odt", False),
+        ("", False),
+    ],
+)
+def test_is_url(fnm: str, expected: bool) -> None:
+    from pathlib import Path
+    from ooodev.utils.lo import Lo
+
+    assert Lo.is_url(fnm) is expected
+    if not expected and fnm:
+        assert Lo.is_url(Path(fnm)) is False
+
+
+def test_dispatch_cmds(loader) -> None:
+    from ooodev.utils.lo import Lo
+    from ooodev.utils.props import Props
+    from ooodev.office.calc import Calc
+    from ooodev.events.args.dispatch_cancel_args import DispatchCancelArgs
+    from ooodev.events.args.dispatch_args import DispatchArgs
+    from ooodev.events.lo_events import Events, is_meth_event
+    from ooodev.events.lo_named_event import LoNamedEvent
+
+    firing = 0
+    fired = 0
+
+    def on(source: Any, args: DispatchCancelArgs) -> None:
+        nonlocal firing
+        assert is_meth_event(source, Lo.dispatch_cmds)
+        assert args.cmd == "GoToCell"
+        firing += 1
+        # cancel the second command only
+        args.cancel = firing == 2
+
+    def after(source: Any, args: DispatchArgs) -> None:
+        nonlocal fired
+        assert is_meth_event(source, Lo.dispatch_cmds)
+        fired += 1
+
+    doc = Calc.create_doc(loader)
+    try:
+        events = Events()
+        events.on(LoNamedEvent.DISPATCHING, on)
+        events.on(LoNamedEvent.DISPATCHED, after)
+
+        frame = Calc.get_controller(doc).getFrame()
+        cmds = [
+            ("GoToCell", Props.make_props(ToPoint="B4")),
+            ("GoToCell", Props.make_props(ToPoint="C7")),
+            ("GoToCell", Props.make_props(ToPoint="D2")),
+        ]
+        results = Lo.dispatch_cmds(cmds, frame)
+        assert results == [True, False, True]
+        assert firing == 3
+        assert fired == 2
+
+        cell = Calc.get_selected_cell_addr(doc=doc)
+        assert cell.Column == 3
+        assert cell.Row == 1
+
+        assert Lo.dispatch_cmds([], frame) == []
+    finally:
+        Lo.close_doc(doc=doc, deliver_ownership=False)
+
+
+def test_print_names(capsys) -> None:
+    from ooodev.utils.lo import Lo
+
+    Lo.print_names(["b", "A", "c"])
+    captured = capsys.readouterr()
+    assert captured.out == "No. of names: 3\n  'A'\n  'b'\n  'c'\n\n\n\n"
+
+    Lo.print_names(["b", "A", "c"], 2)
+    captured = capsys.readouterr()
+    assert captured.out == "No. of names: 3\n  'A'  'b'\n  'c'\n\n\n\n"
+
+    Lo.print_names([], 2)
+    captured = capsys.readouterr()
+    assert captured.out == "No. of names: 0\n\n\n\n"
+
+    Lo.print_names(None)
+    captured = capsys.readouterr()
+    assert captured.out == "  No names found\n"
+
+
+def test_print_table(capsys) -> None:
+    from ooodev.utils.lo import Lo
+
+    Lo.print_table("Tbl", [[1, "a"], [2.5, None]])
+    captured = capsys.readouterr()
+    assert captured.out == "-- Tbl ----------------\n1  a\n2.5  None\n\n"
+
+    Lo.print_table("Empty", [])
+    captured = capsys.readouterr()
+    assert captured.out == "-- Empty ----------------\n\n"
+
+
+@pytest.mark.parametrize(
+    "s, default, expected",
+    [
+        ("12", 0, 12),
+        (" -7 ", 0, -7),
+        ("abc", 0, 0),
+        ("abc", 5, 5),
+        ("1.5", -1, -1),
+        ("", 3, 3),
+        (None, 0, 0),
+        (None, -1, -1),
+    ],
+)
+def test_parse_int(s, default: int, expected: int, capsys) -> None:
+    from ooodev.utils.lo import Lo
+
+    assert Lo.parse_int(s, default) == expected
+    # no output on failure
+    assert capsys.readouterr().out == ""
+    if default == 0:
+        assert Lo.parse_int(s) == expected